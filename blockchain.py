@@ -1,14 +1,185 @@
 
-import hashlib          # For SHA-256 cryptographic hashing
-import json            # For data serialization
+import hashlib         # For SHA-256 cryptographic hashing
+import logging         # For status and rejection messages
 import time            # For timestamps
 import os              # For file operations
-from typing import List, Dict, Optional  # Type hints for better code clarity
-from dataclasses import dataclass, asdict  # For clean data structures
+import struct          # For fixed binary transaction layout
+import sys             # For interning wallet addresses and console output
+import orjson          # Fast canonical JSON encoding for block hashing
+from typing import List, Dict, Optional, Set  # Type hints for better code clarity
+from dataclasses import dataclass, field  # For clean data structures
 from cryptography.hazmat.primitives import hashes  # Cryptographic hash functions
 from cryptography.hazmat.primitives.asymmetric import rsa, padding  # RSA encryption
+from cryptography.hazmat.primitives.asymmetric import ed25519  # Ed25519 signatures
 from cryptography.hazmat.primitives import serialization  # Key serialization
-import pickle          # For blockchain data persistence
+from concurrent.futures import ThreadPoolExecutor  # For parallel signature checks
+from mining import PARALLEL_MINING_MIN_DIFFICULTY, find_nonce, find_nonce_parallel, meets_difficulty, pack_nonce  # Proof-of-Work nonce search
+
+logger = logging.getLogger(__name__)
+
+def _canonical_json(data: Dict) -> bytes:
+    """
+    Serialize data as canonical JSON bytes (sorted keys, no whitespace).
+
+    orjson is always used so every node produces the same bytes; its float
+    formatting differs from the json module's (e.g. 1e-5 vs 1e-05).
+
+    Args:
+        data (Dict): Data to serialize
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+
+def _hash_pairs(level: bytes) -> bytes:
+    """
+    Hash every 64-byte pair of a packed Merkle level in a single pass.
+
+    Args:
+        level (bytes): Concatenated 32-byte node hashes (even count)
+
+    Returns:
+        bytes: Concatenated 32-byte parent hashes (half as many)
+    """
+    # Every input is exactly 64 bytes, so the SHA-256 padding block is always
+    # the same; a native kernel plugged in here can use a hardcoded schedule
+    view = memoryview(level)
+    sha256 = hashlib.sha256
+    return b"".join([sha256(view[i:i + 64]).digest() for i in range(0, len(level), 64)])
+
+def _hash_records(records: List[bytes]) -> List[bytes]:
+    """
+    Hash many independent variable-length records in one pass.
+
+    Args:
+        records (List[bytes]): Messages to hash
+
+    Returns:
+        List[bytes]: Raw 32-byte digest of each record, in order
+    """
+    sha256 = hashlib.sha256
+    return [sha256(record).digest() for record in records]
+
+# Blocks with at least this many transactions build their Merkle tree on all
+# CPU cores; below it, process start-up costs more than the hashing itself
+PARALLEL_MERKLE_MIN_LEAVES = 1 << 14
+
+# Batches with at least this many transactions check their signatures on a
+# thread pool when the machine has more than one core; the cryptography
+# backend releases the GIL while it verifies a signature
+PARALLEL_VERIFY_MIN_TRANSACTIONS = 64
+
+_verify_pool: Optional[ThreadPoolExecutor] = None  # Shared signature-check pool, started on first use
+
+def _get_verify_pool() -> ThreadPoolExecutor:
+    """Get the shared signature-check thread pool, starting it on first use"""
+    global _verify_pool
+    if _verify_pool is None:
+        _verify_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="verify")
+    return _verify_pool
+
+def _merkle_reduce(level: bytes, depth: Optional[int] = None) -> bytes:
+    """
+    Hash a packed Merkle level upwards.
+
+    Args:
+        level (bytes): Concatenated 32-byte node hashes
+        depth (Optional[int]): Number of levels to climb (default: up to the root)
+
+    Returns:
+        bytes: Packed hashes of the level reached
+    """
+    while (len(level) > 32) if depth is None else depth > 0:
+        # If odd number of hashes, duplicate the last one
+        # This ensures we always have pairs to hash together
+        if len(level) % 64:
+            level += level[-32:]
+        
+        # Hash all pairs of the current level to move up one level
+        level = _hash_pairs(level)
+        if depth is not None:
+            depth -= 1
+    return level
+
+def _merkle_subtree_worker(shm_name: str, offset: int, size: int, depth: int) -> bytes:
+    """Reduce one contiguous slice of Merkle leaves held in shared memory."""
+    from multiprocessing import shared_memory  # Only needed for very large blocks
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        level = bytes(shm.buf[offset:offset + size])
+    finally:
+        shm.close()
+    return _merkle_reduce(level, depth)
+
+def build_merkle_parallel(tx_hashes: List[bytes], workers: int) -> bytes:
+    """
+    Build a Merkle root using several processes.
+    
+    Leaves are split into equal power-of-two chunks so each worker reduces a
+    complete subtree; the remaining top levels are hashed sequentially.
+    
+    Args:
+        tx_hashes (List[bytes]): 32-byte transaction hashes (leaf order)
+        workers (int): Number of worker processes
+        
+    Returns:
+        bytes: 32-byte Merkle root
+    """
+    # Process pools are only needed for very large blocks; import on first use
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+    
+    n = len(tx_hashes)
+    depth = (-(-n // workers) - 1).bit_length()   # Smallest 2**depth >= n / workers
+    chunk = 1 << depth
+    
+    shm = shared_memory.SharedMemory(create=True, size=n * 32)
+    try:
+        shm.buf[:n * 32] = b"".join(tx_hashes)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_merkle_subtree_worker, shm.name, start * 32, min(chunk, n - start) * 32, depth)
+                for start in range(0, n, chunk)
+            ]
+            level = b"".join(future.result() for future in futures)
+    finally:
+        shm.close()
+        shm.unlink()
+    
+    return _merkle_reduce(level)
+
+def _merkle_root(tx_hashes: List[bytes]) -> str:
+    """
+    Build a Merkle root from transaction hashes.
+
+    Args:
+        tx_hashes (List[bytes]): Raw 32-byte transaction hashes (leaf order)
+
+    Returns:
+        str: Merkle root hash (64-character hex string), or "0" if empty
+    """
+    # If no transactions, return special "0" value
+    if not tx_hashes:
+        return "0"
+    
+    # Large blocks are split across all CPU cores
+    workers = os.cpu_count() or 1
+    if workers > 1 and len(tx_hashes) >= PARALLEL_MERKLE_MIN_LEAVES:
+        return build_merkle_parallel(tx_hashes, workers).hex()
+    
+    # Pack the whole hash column into one contiguous buffer of 32-byte leaves,
+    # then build the Merkle tree from bottom up, one packed level at a time
+    level = b"".join(tx_hashes)
+    return _merkle_reduce(level).hex()
+
+# Balances are tracked in integer satoshis so sums are exact and independent
+# of the order transactions are applied in
+COIN = 10 ** 8  # Satoshis per coin
+
+def to_satoshis(amount: float) -> int:
+    """Convert a coin amount to integer satoshis (rounded to the nearest one)"""
+    return round(amount * COIN)
 
 # =============================================================================
 # TRANSACTION CLASS - Represents a single transaction in the blockchain
@@ -17,7 +188,7 @@ import pickle          # For blockchain data persistence
 # Each transaction is cryptographically signed to ensure authenticity
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """
     Represents a transaction in the blockchain.
@@ -28,6 +199,23 @@ class Transaction:
     transaction_id: str  # transaction_id
     timestamp: float     # timestamp
     signature: Optional[str] = None  # signature
+    _cached_digest: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _cached_hash: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # Encoded P2P broadcast frame, reused when the transaction is sent again
+    wire_cache: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Fields covered by calculate_hash; writing any of them drops the cached hash
+    _HASHED_FIELDS = frozenset(('sender', 'recipient', 'amount', 'transaction_id', 'timestamp'))
+    # Fields sent over the network; writing any of them drops the cached frame
+    _WIRE_FIELDS = _HASHED_FIELDS | {'signature'}
+    
+    def __setattr__(self, name, value):
+        if name in self._HASHED_FIELDS:
+            object.__setattr__(self, '_cached_digest', None)
+            object.__setattr__(self, '_cached_hash', None)
+        if name in self._WIRE_FIELDS:
+            object.__setattr__(self, 'wire_cache', None)
+        object.__setattr__(self, name, value)
     
     def to_dict(self) -> Dict:
         """
@@ -44,6 +232,62 @@ class Transaction:
             'timestamp': self.timestamp
         }
     
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Transaction':
+        """
+        Rebuild a transaction from its dictionary form.
+        
+        Args:
+            data (Dict): Transaction fields, optionally including the signature
+            
+        Returns:
+            Transaction: The reconstructed transaction
+        """
+        # Addresses repeat across many transactions; interning shares one
+        # string per address and lets balance lookups match by identity.
+        # Arguments are positional (field order) since this runs for every
+        # transaction loaded from disk or received from a peer.
+        return cls(
+            sys.intern(data['sender']),
+            sys.intern(data['recipient']),
+            data['amount'],
+            data['transaction_id'],
+            data['timestamp'],
+            data.get('signature')
+        )
+    
+    def _canonical_bytes(self) -> bytes:
+        """
+        Encode the signed fields of this transaction in a fixed binary layout.
+        
+        Layout: length-prefixed sender, recipient and transaction_id (UTF-8),
+        followed by amount and timestamp as little-endian doubles.
+        
+        Returns:
+            bytes: Deterministic encoding used for hashing and signing
+        """
+        sender = self.sender.encode()
+        recipient = self.recipient.encode()
+        transaction_id = self.transaction_id.encode()
+        return b"".join((
+            struct.pack('<H', len(sender)), sender,
+            struct.pack('<H', len(recipient)), recipient,
+            struct.pack('<H', len(transaction_id)), transaction_id,
+            struct.pack('<dd', self.amount, self.timestamp)
+        ))
+    
+    def calculate_hash_bytes(self) -> bytes:
+        """
+        Calculate the raw SHA-256 digest of this transaction.
+        
+        Returns:
+            bytes: 32-byte digest
+        """
+        # Hash the fixed binary encoding once; later calls reuse the result
+        if self._cached_digest is None:
+            object.__setattr__(self, '_cached_digest', hashlib.sha256(self._canonical_bytes()).digest())
+        return self._cached_digest
+    
     def calculate_hash(self) -> str:
         """
         Calculate the SHA-256 hash of this transaction.
@@ -51,10 +295,10 @@ class Transaction:
         Returns:
             str: 64-character hexadecimal hash string
         """
-        # Convert transaction to JSON string (sorted for consistency)
-        transaction_string = json.dumps(self.to_dict(), sort_keys=True)
-        # Create SHA-256 hash and return as hex string
-        return hashlib.sha256(transaction_string.encode()).hexdigest()
+        # Hex is only needed for display and external formats
+        if self._cached_hash is None:
+            object.__setattr__(self, '_cached_hash', self.calculate_hash_bytes().hex())
+        return self._cached_hash
 
 # =============================================================================
 # BLOCK CLASS - Represents a single block in the blockchain
@@ -63,7 +307,7 @@ class Transaction:
 # to the previous block, creating an immutable chain
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Block:
     
     index: int                    # Block number 
@@ -73,28 +317,201 @@ class Block:
     nonce: int                    # Proof-of-Work number
     difficulty: int               # Mining difficulty target
     merkle_root: str              # Merkle tree root hash
+    hash: Optional[str] = field(default=None, compare=False)  # Stored hash of the mined block
+    _hash_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _prefix_cache: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _midstate_cache: Optional[object] = field(default=None, init=False, repr=False, compare=False)
+    _merkle_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _tx_hashes: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # Packed 32-byte hashes of one interior Merkle level, used for inclusion proofs
+    merkle_layer_cache: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    # Encoded P2P broadcast frame, reused when the block is sent again
+    wire_cache: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Fields that are not part of the hashed block data
+    _UNHASHED_FIELDS = frozenset(('hash', 'merkle_layer_cache', 'wire_cache'))
+    
+    def __post_init__(self):
+        # Hash every transaction not hashed yet in one batch, so the Merkle
+        # leaves of a freshly built or received block are ready up front
+        unhashed = [tx for tx in self.transactions if tx._cached_digest is None]
+        if unhashed:
+            digests = _hash_records([tx._canonical_bytes() for tx in unhashed])
+            for tx, digest in zip(unhashed, digests):
+                object.__setattr__(tx, '_cached_digest', digest)
+    
+    def __setattr__(self, name, value):
+        # Any change to a block field (e.g. nonce while mining) drops the cached hash;
+        # only changes to fields other than the nonce drop the cached header prefix.
+        if name in self.__dataclass_fields__ and not name.startswith('_') and name != 'wire_cache':
+            object.__setattr__(self, 'wire_cache', None)
+        if (name in self.__dataclass_fields__ and not name.startswith('_')
+                and name not in self._UNHASHED_FIELDS):
+            object.__setattr__(self, '_hash_cache', None)
+            if name != 'nonce':
+                object.__setattr__(self, '_prefix_cache', None)
+            if name == 'transactions':
+                object.__setattr__(self, '_merkle_cache', None)
+                object.__setattr__(self, 'merkle_layer_cache', None)
+        object.__setattr__(self, name, value)
+    
+    def _refresh_tx_hashes(self) -> tuple:
+        """
+        Drop cached values if any transaction changed since they were computed.
+        
+        Transaction hashes are memoized, so this costs no hashing unless a
+        transaction was modified in place.
+        
+        Returns:
+            tuple: Current raw transaction hashes
+        """
+        tx_hashes = tuple(tx.calculate_hash_bytes() for tx in self.transactions)
+        if tx_hashes != self._tx_hashes:
+            object.__setattr__(self, '_tx_hashes', tx_hashes)
+            object.__setattr__(self, '_hash_cache', None)
+            object.__setattr__(self, '_prefix_cache', None)
+            object.__setattr__(self, '_merkle_cache', None)
+            object.__setattr__(self, 'merkle_layer_cache', None)
+        return tx_hashes
+    
+    def calculate_merkle_root(self) -> str:
+        """
+        Calculate the Merkle root of this block's transactions (cached).
+        
+        Returns:
+            str: Merkle root hash (64-character hex string)
+        """
+        tx_hashes = self._refresh_tx_hashes()
+        if self._merkle_cache is None:
+            object.__setattr__(self, '_merkle_cache', _merkle_root(list(tx_hashes)))
+        return self._merkle_cache
+    
+    def _merkle_proof_depth(self) -> int:
+        """
+        Number of levels between the leaves and the cached Merkle layer.
+        
+        For a tree of height H the cached layer sits L = H // 2 levels below
+        the root, so a proof only needs H - L sibling hashes.
+        """
+        height = (len(self.transactions) - 1).bit_length()
+        return height - height // 2
+    
+    def build_merkle_layer_cache(self) -> bytes:
+        """
+        Compute and cache the interior Merkle layer used for inclusion proofs.
+        
+        Returns:
+            bytes: Packed 32-byte hashes of the cached layer
+        """
+        self._refresh_tx_hashes()
+        if self.merkle_layer_cache is None:
+            leaves = b"".join(self._tx_hashes)
+            object.__setattr__(self, 'merkle_layer_cache', _merkle_reduce(leaves, self._merkle_proof_depth()))
+        return self.merkle_layer_cache
+    
+    def merkle_proof(self, tx_index: int) -> List[bytes]:
+        """
+        Build an inclusion proof for a transaction up to the cached Merkle layer.
+        
+        Args:
+            tx_index (int): Position of the transaction in this block
+            
+        Returns:
+            List[bytes]: Sibling hashes from the leaf up to the cached layer
+        """
+        self.build_merkle_layer_cache()
+        level = b"".join(self._tx_hashes)
+        proof = []
+        for _ in range(self._merkle_proof_depth()):
+            if len(level) % 64:
+                level += level[-32:]
+            sibling = tx_index ^ 1
+            proof.append(level[sibling * 32:sibling * 32 + 32])
+            level = _hash_pairs(level)
+            tx_index >>= 1
+        return proof
+    
+    def verify_tx_inclusion(self, tx_hash: bytes, tx_index: int, proof: List[bytes]) -> bool:
+        """
+        Check that a transaction hash is part of this block.
+        
+        The proof is only climbed up to the cached Merkle layer and compared
+        there, which saves the hashes between that layer and the root.
+        
+        Args:
+            tx_hash (bytes): Raw 32-byte transaction hash
+            tx_index (int): Position of the transaction in this block
+            proof (List[bytes]): Sibling hashes from merkle_proof
+            
+        Returns:
+            bool: True if the transaction is included at that position
+        """
+        if len(proof) != self._merkle_proof_depth():
+            return False
+        
+        node = tx_hash
+        for sibling in proof:
+            node = hashlib.sha256(sibling + node if tx_index & 1 else node + sibling).digest()
+            tx_index >>= 1
+        
+        layer = self.build_merkle_layer_cache()
+        return layer[tx_index * 32:tx_index * 32 + 32] == node
+    
+    def header_prefix(self) -> bytes:
+        """
+        Serialize every block field except the nonce (cached).
+        
+        The block hash is SHA-256(header_prefix + nonce), so mining only has
+        to append a new nonce to these bytes for each attempt.
+        
+        Returns:
+            bytes: Serialized block data without the nonce
+        """
+        self._refresh_tx_hashes()
+        if self._prefix_cache is None:
+            # Create a dictionary with all block data (excluding the hash and nonce)
+            block_data = {
+                'index': self.index,
+                'timestamp': self.timestamp,
+                'transactions': [tx.to_dict() for tx in self.transactions],  # Convert transactions to dicts
+                'previous_hash': self.previous_hash,
+                'difficulty': self.difficulty,
+                'merkle_root': self.merkle_root
+            }
+            # Convert to canonical JSON (sorted for consistency)
+            prefix = _canonical_json(block_data)
+            object.__setattr__(self, '_prefix_cache', prefix)
+            # SHA-256 state after absorbing the prefix; only the nonce is hashed on top
+            object.__setattr__(self, '_midstate_cache', hashlib.sha256(prefix))
+        return self._prefix_cache
     
     def calculate_hash(self) -> str:
         """
-        Calculate the SHA-256 hash of this block.
+        Calculate the SHA-256 hash of this block (cached until the block changes).
         
         Returns:
             str: 64-character hexadecimal hash string
         """
-        # Create a dictionary with all block data (excluding the hash itself)
-        block_data = {
-            'index': self.index,
-            'timestamp': self.timestamp,
-            'transactions': [tx.to_dict() for tx in self.transactions],  # Convert transactions to dicts
-            'previous_hash': self.previous_hash,
-            'nonce': self.nonce,
-            'difficulty': self.difficulty,
-            'merkle_root': self.merkle_root
-        }
+        self.header_prefix()
+        if self._hash_cache is None:
+            object.__setattr__(self, '_hash_cache', self.hash_with_nonce(pack_nonce(self.nonce)).hex())
+        return self._hash_cache
+    
+    def hash_with_nonce(self, nonce_bytes: bytes) -> bytes:
+        """
+        Hash this block with a candidate nonce, resuming from the cached
+        SHA-256 midstate of the header prefix.
         
-        # Convert to JSON string (sorted for consistency) and hash
-        block_string = json.dumps(block_data, sort_keys=True)
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        Args:
+            nonce_bytes (bytes): Nonce encoded with pack_nonce
+            
+        Returns:
+            bytes: Raw 32-byte block hash
+        """
+        self.header_prefix()
+        h = self._midstate_cache.copy()
+        h.update(nonce_bytes)
+        return h.digest()
     
     def to_dict(self) -> Dict:
         """
@@ -106,12 +523,72 @@ class Block:
         return {
             'index': self.index,
             'timestamp': self.timestamp,
-            'transactions': [asdict(tx) for tx in self.transactions],  # Include all transaction fields
+            'transactions': [dict(tx.to_dict(), signature=tx.signature) for tx in self.transactions],  # Include all transaction fields
             'previous_hash': self.previous_hash,
             'nonce': self.nonce,
             'difficulty': self.difficulty,
             'merkle_root': self.merkle_root
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Block':
+        """
+        Rebuild a block from its dictionary form.
+        
+        Args:
+            data (Dict): Block fields as produced by to_dict, plus 'hash'
+            
+        Returns:
+            Block: The reconstructed block
+        """
+        # Positional arguments in field order, as in Transaction.from_dict
+        from_dict = Transaction.from_dict
+        return cls(
+            data['index'],
+            data['timestamp'],
+            [from_dict(tx) for tx in data['transactions']],
+            data['previous_hash'],
+            data['nonce'],
+            data['difficulty'],
+            data['merkle_root'],
+            data['hash']
+        )
+
+def _verify_with_key(public_key, data: bytes, signature: str) -> bool:
+    """
+    Verify a hex signature over data with an Ed25519 or RSA public key.
+    
+    Args:
+        public_key: Ed25519 or RSA public key object
+        data (bytes): The signed data
+        signature (str): The signature to verify (hex string)
+        
+    Returns:
+        bool: True if signature is valid, False otherwise
+    """
+    try:
+        # Convert hex signature back to bytes
+        signature_bytes = bytes.fromhex(signature)
+        
+        # Verify the signature using the public key
+        # This will raise an exception if the signature is invalid
+        if isinstance(public_key, ed25519.Ed25519PublicKey):
+            public_key.verify(signature_bytes, data)
+        else:
+            public_key.verify(
+                signature_bytes,                    # The signature to verify
+                data,                               # The original data
+                padding.PSS(                       # Same padding as signing
+                    mgf=padding.MGF1(hashes.SHA256()),
+                    salt_length=padding.PSS.MAX_LENGTH
+                ),
+                hashes.SHA256()                    # Same hash function
+            )
+        return True  # Signature is valid
+        
+    except Exception:
+        # Signature verification failed (invalid, corrupted, or forged)
+        return False
 
 # =============================================================================
 # WALLET CLASS - Manages cryptographic keys and transaction signing
@@ -123,32 +600,46 @@ class Block:
 
 class Wallet:
     """
-    Simple wallet implementation with RSA public/private key pairs.
+    Simple wallet implementation with public/private key pairs.
     
     The wallet provides:
-    - Key generation (2048-bit RSA keys)
+    - Key generation (Ed25519 by default, 2048-bit RSA for backward compatibility)
     - Transaction signing with private key
     - Signature verification with public key
     - Secure key storage and management
     
     """
     
-    def __init__(self, name: str):
+    __slots__ = ('name', 'algo', 'private_key', 'public_key', 'public_key_pem')
+    
+    def __init__(self, name: str, algo: str = 'ed25519'):
         """
         Initialize a new wallet with cryptographic keys.
         
         Args:
             name (str): Human-readable name for this wallet
+            algo (str): Signature algorithm, 'ed25519' (default) or 'rsa'
             
         """
-        self.name = name
+        if algo not in ('ed25519', 'rsa'):
+            raise ValueError(f"Unsupported signature algorithm: {algo}")
         
-        # Generate a new RSA private key (2048 bits for security)
-        # 65537 is the standard public exponent used in RSA
-        self.private_key = rsa.generate_private_key(
-            public_exponent=65537,  # Standard RSA exponent
-            key_size=2048           # 2048 bits for strong security
-        )
+        self.name = name
+        self.algo = algo
+        self._generate_keys()
+    
+    def _generate_keys(self):
+        """Generate a new key pair for this wallet's algorithm."""
+        if self.algo == 'ed25519':
+            # Ed25519 signs and verifies far faster than RSA with much smaller keys
+            self.private_key = ed25519.Ed25519PrivateKey.generate()
+        else:
+            # Generate a new RSA private key (2048 bits for security)
+            # 65537 is the standard public exponent used in RSA
+            self.private_key = rsa.generate_private_key(
+                public_exponent=65537,  # Standard RSA exponent
+                key_size=2048           # 2048 bits for strong security
+            )
         
         # Extract the public key from the private key
         self.public_key = self.private_key.public_key()
@@ -159,20 +650,68 @@ class Wallet:
             format=serialization.PublicFormat.SubjectPublicKeyInfo  # Standard format
         ).decode()  # Convert bytes to string
     
+    def _load_private_key(self, private_key_der: bytes):
+        """Restore the key pair from a PKCS#8 DER-encoded private key."""
+        self.private_key = serialization.load_der_private_key(private_key_der, password=None)
+        self.public_key = self.private_key.public_key()
+        self.public_key_pem = self.public_key.public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo
+        ).decode()
+    
+    def _private_key_der(self) -> bytes:
+        """Encode the private key as unencrypted PKCS#8 DER."""
+        return self.private_key.private_bytes(
+            encoding=serialization.Encoding.DER,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        )
+    
+    def to_dict(self) -> Dict:
+        """
+        Convert wallet to dictionary format for storage.
+        
+        Returns:
+            Dict: Wallet name, algorithm and hex-encoded private key
+        """
+        return {
+            'name': self.name,
+            'algo': self.algo,
+            'private_key': self._private_key_der().hex()
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Wallet':
+        """
+        Restore a wallet saved with to_dict.
+        
+        Args:
+            data (Dict): Wallet dictionary
+            
+        Returns:
+            Wallet: Wallet with its original key pair
+        """
+        wallet = cls.__new__(cls)
+        wallet.name = data['name']
+        wallet.algo = data['algo']
+        wallet._load_private_key(bytes.fromhex(data['private_key']))
+        return wallet
+    
     def __getstate__(self):
         """
         Custom serialization method to handle private key objects.
         
         This method is called by pickle when saving the wallet.
-        We exclude the private key because it cannot be serialized.
+        Key objects cannot be pickled, so the private key is stored as
+        PKCS#8 DER bytes instead.
         
         Returns:
-            dict: Wallet state without private key objects
+            dict: Wallet state with the private key encoded as DER
         """
-        state = self.__dict__.copy()
-        # Remove the private key (can't be pickled)
+        state = {slot: getattr(self, slot) for slot in self.__slots__}
+        state['_private_key_der'] = self._private_key_der()
+        # Remove the key objects (can't be pickled)
         state['private_key'] = None
-        # Remove the public key object (can't be pickled)
         state['public_key'] = None
         return state
     
@@ -181,27 +720,24 @@ class Wallet:
         Custom deserialization method to handle private key objects.
         
         This method is called by pickle when loading the wallet.
-        We regenerate the private key since it couldn't be saved.
+        The key pair is restored from the saved DER bytes so signatures
+        made before saving remain valid.
         
         Args:
             state (dict): Wallet state from pickle
         """
-        self.__dict__.update(state)
-        
-        
-        self.private_key = rsa.generate_private_key(
-            public_exponent=65537,
-            key_size=2048
-        )
-        
-        # Regenerate public key from the new private key
-        self.public_key = self.private_key.public_key()
-        
-        # Update the PEM representation
-        self.public_key_pem = self.public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo
-        ).decode()
+        private_key_der = state.pop('_private_key_der', None)
+        for name, value in state.items():
+            setattr(self, name, value)
+        
+        # Wallets saved before Ed25519 support were always RSA
+        self.algo = state.get('algo', 'rsa')
+        
+        if private_key_der is not None:
+            self._load_private_key(private_key_der)
+        else:
+            # Wallets saved by older versions did not keep their keys
+            self._generate_keys()
     
     def sign_transaction(self, transaction: Transaction) -> str:
         """
@@ -214,18 +750,21 @@ class Wallet:
             str: Hexadecimal representation of the digital signature
             
         """
-        # Convert transaction to JSON string 
-        transaction_string = json.dumps(transaction.to_dict(), sort_keys=True)
-        
-        # Create digital signature using RSA-PSS with SHA-256
-        signature = self.private_key.sign(
-            transaction_string.encode(),  # Convert string to bytes
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),  # Mask generation function
-                salt_length=padding.PSS.MAX_LENGTH   # Maximum salt for security
-            ),
-            hashes.SHA256()  # Use SHA-256 for hashing
-        )
+        data = transaction._canonical_bytes()  # Fixed binary encoding
+        
+        if self.algo == 'ed25519':
+            # Ed25519 hashes internally, so no padding or hash choice is needed
+            signature = self.private_key.sign(data)
+        else:
+            # Create digital signature using RSA-PSS with SHA-256
+            signature = self.private_key.sign(
+                data,
+                padding.PSS(
+                    mgf=padding.MGF1(hashes.SHA256()),  # Mask generation function
+                    salt_length=padding.PSS.MAX_LENGTH   # Maximum salt for security
+                ),
+                hashes.SHA256()  # Use SHA-256 for hashing
+            )
         
         # Return signature as hexadecimal string for easy storage/transmission
         return signature.hex()
@@ -241,29 +780,7 @@ class Wallet:
         Returns:
             bool: True if signature is valid, False otherwise
         """
-        try:
-            # Convert transaction to same format used for signing
-            transaction_string = json.dumps(transaction.to_dict(), sort_keys=True)
-            
-            # Convert hex signature back to bytes
-            signature_bytes = bytes.fromhex(signature)
-            
-            # Verify the signature using the public key
-            # This will raise an exception if the signature is invalid
-            self.public_key.verify(
-                signature_bytes,                    # The signature to verify
-                transaction_string.encode(),        # The original data
-                padding.PSS(                       # Same padding as signing
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH
-                ),
-                hashes.SHA256()                    # Same hash function
-            )
-            return True  # Signature is valid
-            
-        except Exception:
-            # Signature verification failed (invalid, corrupted, or forged)
-            return False
+        return _verify_with_key(self.public_key, transaction._canonical_bytes(), signature)
 
 # =============================================================================
 # BLOCKCHAIN CLASS - Main blockchain implementation and management
@@ -305,7 +822,16 @@ class Blockchain:
         self.wallets: Dict[str, Wallet] = {}            # Collection of wallets by name
         self.mining_reward = 50.0                       # Reward for mining a block
         self.target_block_time = 10.0                   # Target time between blocks (seconds)
-        self.last_mining_time = 0.0                     # Time of last block mining
+        self.last_mining_time = 0.0                     # Monotonic clock reading of last block mining
+        self._pubkeys: Dict[str, object] = {}           # Parsed public keys by wallet address
+        self.transaction_ids: Set[str] = set()          # IDs of all transactions in the chain and mempool
+        self.balances: Dict[str, int] = {}              # Confirmed balance of every address (satoshis)
+        self.pending_delta: Dict[str, int] = {}         # Net balance change from pending transactions (satoshis)
+        self.pending_senders: Set[str] = set()          # Senders with a transaction in the mempool
+        # Block log path -> (blocks written, last block hash, file size, byte offset of each block's line)
+        self._block_logs: Dict[str, tuple] = {}
+        self._block_log_path: Optional[str] = None      # Block log last written or loaded
+        self._snapshot: Optional[tuple] = None          # (directory, chain tip, wallet names) of the last snapshot
         
         # Create the first block (genesis block) to start the chain
         self.create_genesis_block()
@@ -341,39 +867,13 @@ class Blockchain:
         Returns:
             str: Merkle root hash (64-character hex string)
         """
-        # If no transactions, return special "0" value
-        if not transactions:
-            return "0"
-        
-        # Convert all transactions to their hashes
-        # These hashes become the leaf nodes of the Merkle tree
-        tx_hashes = [tx.calculate_hash() for tx in transactions]
-        
-        # Build the Merkle tree from bottom up
-        while len(tx_hashes) > 1:
-            # If odd number of hashes, duplicate the last one
-            # This ensures we always have pairs to hash together
-            if len(tx_hashes) % 2 == 1:
-                tx_hashes.append(tx_hashes[-1])
-            
-            # Create new level by hashing pairs of hashes
-            new_level = []
-            for i in range(0, len(tx_hashes), 2):
-                # Combine two hashes and hash them together
-                combined = tx_hashes[i] + tx_hashes[i + 1]
-                new_level.append(hashlib.sha256(combined.encode()).hexdigest())
-            
-            # Move up one level in the tree
-            tx_hashes = new_level
-        
-        # Return the root hash 
-        return tx_hashes[0] if tx_hashes else "0"
+        return _merkle_root([tx.calculate_hash_bytes() for tx in transactions])
     
     def get_latest_block(self) -> Block:
         """Get the most recent block in the chain"""
         return self.chain[-1]
     
-    def add_transaction(self, sender: str, recipient: str, amount: float, wallet: Wallet) -> bool:
+    def add_transaction(self, sender: str, recipient: str, amount: float, wallet: Wallet) -> Optional[Transaction]:
         """
         Add a new transaction to the pending transactions pool.
         
@@ -384,43 +884,233 @@ class Blockchain:
             wallet (Wallet): The sender's wallet (for signing)
             
         Returns:
-            bool: True if transaction was added successfully, False otherwise
+            Optional[Transaction]: The added transaction, or None if it was rejected
             
         Note: Transactions are not immediately added to the blockchain.
         They wait in the pending pool until a block is mined.
         """
         # Check if sender has sufficient balance
-        if sender != "Genesis" and self.get_balance(sender) < amount:
-            print(f"Insufficient balance for {sender}")
-            return False
+        if sender != "Genesis" and self._balance_satoshis(sender) < to_satoshis(amount):
+            logger.warning("Insufficient balance for %s", sender)
+            return None
         
         #Create the transaction object
+        now = time.time()
         transaction = Transaction(
             sender=sender,
             recipient=recipient,
             amount=amount,
             # Create unique transaction ID using sender, recipient, and timestamp
-            transaction_id=f"{sender}_{recipient}_{int(time.time())}",
-            timestamp=time.time()
+            transaction_id=f"{sender}_{recipient}_{int(now)}",
+            timestamp=now
         )
         
+        # Reject reused transaction IDs before doing any signing work
+        if transaction.transaction_id in self.transaction_ids:
+            logger.warning("Duplicate transaction ID: %s", transaction.transaction_id)
+            return None
+        
+        # A sender may only have one transaction waiting in the mempool
+        if sender != "Genesis" and sender in self.pending_senders:
+            logger.warning("Double-spend detected!")
+            return None
+        
         # Sign the transaction with the sender's private key
         transaction.signature = wallet.sign_transaction(transaction)
         
         # Verify the signature is valid
         if not wallet.verify_signature(transaction, transaction.signature):
-            print("Invalid transaction signature")
-            return False
+            logger.warning("Invalid transaction signature")
+            return None
         
         # Check for double-spend attempts
         if not self.is_valid_transaction(transaction):
-            print("Double-spend detected!")
-            return False
+            logger.warning("Double-spend detected!")
+            return None
         
         # Add transaction to pending pool
+        self.add_pending_transaction(transaction)
+        logger.info("Transaction added: %s -> %s: %s", sender, recipient, amount)
+        return transaction
+    
+    def add_pending_transaction(self, transaction: Transaction):
+        """
+        Append an already validated transaction to the pending pool.
+        
+        Keeps the transaction ID index, the pending balance deltas and the
+        pending sender set in step with pending_transactions.
+        
+        Args:
+            transaction (Transaction): Transaction to queue for mining
+        """
         self.pending_transactions.append(transaction)
-        print(f"Transaction added: {sender} -> {recipient}: {amount}")
-        return True
+        self.transaction_ids.add(transaction.transaction_id)
+        self._apply_to_balances(self.pending_delta, transaction)
+        self.pending_senders.add(transaction.sender)
+    
+    def remove_pending_transactions(self, transaction_ids: Set[str]):
+        """
+        Drop transactions from the pending pool, e.g. once a peer's block confirmed them.
+        
+        The pool is compacted in place rather than copied, and the pending
+        deltas are adjusted only for the removed transactions.
+        
+        Args:
+            transaction_ids (Set[str]): IDs of the transactions to remove
+        """
+        pending = self.pending_transactions
+        removed_senders = set()
+        kept = 0
+        for tx in pending:
+            if tx.transaction_id in transaction_ids:
+                amount = to_satoshis(tx.amount)
+                self.pending_delta[tx.recipient] -= amount
+                self.pending_delta[tx.sender] += amount
+                removed_senders.add(tx.sender)
+            else:
+                pending[kept] = tx
+                kept += 1
+        del pending[kept:]
+        
+        if removed_senders:
+            # A sender stays pending if another of its transactions is still queued
+            self.pending_senders -= removed_senders
+            for tx in pending:
+                if tx.sender in removed_senders:
+                    self.pending_senders.add(tx.sender)
+    
+    @staticmethod
+    def _apply_to_balances(balances: Dict[str, int], transaction: Transaction):
+        """Credit the recipient and debit the sender of a transaction (in satoshis)"""
+        amount = to_satoshis(transaction.amount)
+        balances[transaction.recipient] = balances.get(transaction.recipient, 0) + amount
+        balances[transaction.sender] = balances.get(transaction.sender, 0) - amount
+    
+    def _public_key_for(self, address: str):
+        """
+        Get the parsed public key of a wallet address, parsing its PEM only once.
+        
+        Args:
+            address (str): Wallet name/address
+            
+        Returns:
+            Public key object, or None if the address has no known wallet
+        """
+        public_key = self._pubkeys.get(address)
+        if public_key is None:
+            wallet = self.wallets.get(address)
+            if wallet is None:
+                return None
+            public_key = serialization.load_pem_public_key(wallet.public_key_pem.encode())
+            self._pubkeys[address] = public_key
+        return public_key
+    
+    @staticmethod
+    def _signer_of(transaction: Transaction) -> str:
+        """Address whose key signs a transaction; Genesis grants are signed by the recipient"""
+        return transaction.recipient if transaction.sender == "Genesis" else transaction.sender
+    
+    def verify_signature(self, address: str, transaction: Transaction) -> bool:
+        """
+        Verify a transaction signature against a wallet address.
+        
+        Args:
+            address (str): Address of the wallet that signed the transaction
+            transaction (Transaction): The signed transaction
+            
+        Returns:
+            bool: True if the signature is valid for that address
+        """
+        public_key = self._public_key_for(address)
+        if public_key is None or transaction.signature is None:
+            return False
+        return _verify_with_key(public_key, transaction._canonical_bytes(), transaction.signature)
+    
+    def verify_transactions(self, transactions: List[Transaction]) -> List[bool]:
+        """
+        Verify the signatures of many transactions.
+        
+        Mining rewards are unsigned and always pass. Genesis grants are signed
+        by the receiving wallet. Large batches on multi-core machines are
+        split into one slice per core and checked on a shared thread pool.
+        
+        Args:
+            transactions (List[Transaction]): Transactions to verify
+            
+        Returns:
+            List[bool]: Whether each transaction's signature is valid, in order
+        """
+        def check(tx: Transaction) -> bool:
+            if tx.sender == "System":
+                return True
+            return self.verify_signature(self._signer_of(tx), tx)
+        
+        workers = os.cpu_count() or 1
+        if workers < 2 or len(transactions) < PARALLEL_VERIFY_MIN_TRANSACTIONS:
+            return [check(tx) for tx in transactions]
+        
+        # Parse every signer's key up front so worker threads only read the cache
+        for tx in transactions:
+            self._public_key_for(self._signer_of(tx))
+        
+        # One slice per core keeps the hand-off down to a few futures per batch
+        step = -(-len(transactions) // workers)
+        slices = [transactions[i:i + step] for i in range(0, len(transactions), step)]
+        results = _get_verify_pool().map(lambda part: [check(tx) for tx in part], slices)
+        return [valid for part in results for valid in part]
+    
+    def verify_block(self, block: Block) -> bool:
+        """
+        Verify the signatures of all signed transactions in a block.
+        
+        Args:
+            block (Block): Block whose transactions should be verified
+            
+        Returns:
+            bool: True if every signed transaction has a valid signature
+        """
+        return all(self.verify_transactions(block.transactions))
+    
+    def add_transactions_batch(self, transactions: List[Transaction],
+                               allow_unknown_signers: bool = False) -> List[Transaction]:
+        """
+        Add a batch of already signed transactions to the pending pool.
+        
+        Duplicates are dropped before any signature work, the remaining
+        signatures are verified together with verify_transactions, and the
+        balance and double-spend checks then run in batch order.
+        
+        Args:
+            transactions (List[Transaction]): Signed transactions, e.g. from a peer
+            allow_unknown_signers (bool): Accept transactions signed by wallets
+                this node has no key for (nodes do not share wallet keys);
+                they still go through the balance and double-spend checks
+            
+        Returns:
+            List[Transaction]: The transactions that were accepted
+        """
+        candidates = []
+        batch_ids = set()
+        for tx in transactions:
+            if tx.transaction_id in self.transaction_ids or tx.transaction_id in batch_ids:
+                logger.warning("Duplicate transaction ID: %s", tx.transaction_id)
+                continue
+            batch_ids.add(tx.transaction_id)
+            candidates.append(tx)
+        
+        accepted = []
+        for tx, signature_valid in zip(candidates, self.verify_transactions(candidates)):
+            if not signature_valid and not (
+                    allow_unknown_signers and self._public_key_for(self._signer_of(tx)) is None):
+                logger.warning("Invalid transaction signature: %s", tx.transaction_id)
+            elif not self.is_valid_transaction(tx):
+                logger.warning("Double-spend detected!")
+            else:
+                self.add_pending_transaction(tx)
+                accepted.append(tx)
+        
+        logger.info("Accepted %d of %d transactions", len(accepted), len(transactions))
+        return accepted
     
     def is_valid_transaction(self, transaction: Transaction) -> bool:
         """Check if transaction is valid (no double-spend)"""
@@ -428,44 +1118,39 @@ class Blockchain:
             return True
         
         # Check if sender has sufficient balance
-        sender_balance = self.get_balance(transaction.sender)
-        if sender_balance < transaction.amount:
+        sender_balance = self._balance_satoshis(transaction.sender)
+        if sender_balance < to_satoshis(transaction.amount):
             return False
         
         # Check for double-spend in pending transactions
-        for pending_tx in self.pending_transactions:
-            if (pending_tx.sender == transaction.sender and 
-                pending_tx.transaction_id != transaction.transaction_id):
-                return False
+        if transaction.sender in self.pending_senders:
+            return False
         
         return True
     
     def get_balance(self, address: str) -> float:
-        """Get current balance of an address"""
-        balance = 0.0
-        
-        # Process all blocks to calculate balance
-        for block in self.chain:
-            for tx in block.transactions:
-                if tx.recipient == address:
-                    balance += tx.amount
-                if tx.sender == address:
-                    balance -= tx.amount
-        
-        # Process pending transactions
-        for tx in self.pending_transactions:
-            if tx.recipient == address:
-                balance += tx.amount
-            if tx.sender == address:
-                balance -= tx.amount
-        
-        return balance
+        """Get current balance of an address (confirmed plus pending)"""
+        return self._balance_satoshis(address) / COIN
     
-    def mine_block(self, miner_address: str) -> Optional[Block]:
-       
+    def _balance_satoshis(self, address: str) -> int:
+        """Get current balance of an address in satoshis (confirmed plus pending)"""
+        return self.balances.get(address, 0) + self.pending_delta.get(address, 0)
+    
+    def mine_block(self, miner_address: str, parallel: Optional[bool] = None) -> Optional[Block]:
+        """
+        Mine the pending transactions into a new block.
+        
+        Args:
+            miner_address (str): Wallet that receives the mining reward
+            parallel (Optional[bool]): Search nonces on all CPU cores; by
+                default only for difficulty >= PARALLEL_MINING_MIN_DIFFICULTY
+            
+        Returns:
+            Optional[Block]: The mined block, or None if nothing was pending
+        """
         # Check if there are transactions to mine
         if not self.pending_transactions:
-            print("No transactions to mine")
+            logger.info("No transactions to mine")
             return None
         
         # Get information about the previous block
@@ -478,19 +1163,21 @@ class Blockchain:
             sender="System",
             recipient=miner_address,
             amount=self.mining_reward,
-            transaction_id=f"reward_{new_index}_{int(time.time())}",
-            timestamp=time.time()
+            transaction_id=f"reward_{new_index}_{int(new_timestamp)}",
+            timestamp=new_timestamp
         )
         
-        # Prepare all transactions for the block (pending + reward)
-        all_transactions = self.pending_transactions.copy() + [reward_transaction]
+        # Prepare all transactions for the block (pending + reward). The block
+        # gets its own copy: transactions that arrive from peers while the
+        # nonce is searched must not change a block whose header is hashed.
+        all_transactions = [*self.pending_transactions, reward_transaction]
         
         # Create the new block structure
         new_block = Block(
             index=new_index,                                    # Next block number
             timestamp=new_timestamp,                            # Current time
             transactions=all_transactions,                      # All transactions including reward
-            previous_hash=previous_block.calculate_hash(),       # Link to previous block
+            previous_hash=previous_block.hash,                  # Link to previous block (stored, already validated)
             nonce=0,                                            # Start with nonce 0
             difficulty=self.difficulty,                         # Current difficulty target
             merkle_root=self.calculate_merkle_root(all_transactions)  # Hash of all transactions
@@ -498,66 +1185,94 @@ class Blockchain:
         
         # Mine the block (Proof-of-Work)
         # The target is a string of zeros (e.g., "0000" for difficulty 4)
-        target = "0" * self.difficulty
-        print(f"Mining block {new_index} with difficulty {self.difficulty}...")
-        
-        # Start mining: try different nonce values until we find a valid hash
-        start_time = time.time()
-        while True:
-            # Try the next nonce value
-            new_block.nonce += 1
-            
-            # Calculate the block hash with current nonce
-            block_hash = new_block.calculate_hash()
-            
-            # Check if the hash meets the difficulty requirement
-            if block_hash.startswith(target):
-                # We found a valid solution!
-                mining_time = time.time() - start_time
-                print(f"Block mined! Hash: {block_hash[:20]}...")
-                print(f"Mining time: {mining_time:.2f} seconds")
-                print(f"Nonce: {new_block.nonce}")
-                break
+        logger.info("Mining block %d with difficulty %d...", new_index, self.difficulty)
+        
+        # Start mining: try different nonce values until we find a valid hash.
+        # Only the nonce changes between attempts, so the rest of the block is
+        # serialized once and reused for every attempt.
+        # Hard targets are searched on all CPU cores in disjoint nonce ranges.
+        if parallel is None:
+            parallel = new_block.difficulty >= PARALLEL_MINING_MIN_DIFFICULTY
+        start_time = time.monotonic()
+        if parallel:
+            new_block.nonce, block_hash = find_nonce_parallel(new_block.header_prefix(), new_block.difficulty, start=1)
+        else:
+            new_block.nonce, block_hash = find_nonce(new_block.header_prefix(), new_block.difficulty, start=1)
+        mining_time = time.monotonic() - start_time
+        logger.info("Block mined! Hash: %s...", block_hash[:20])
+        logger.info("Mining time: %.2f seconds", mining_time)
+        logger.info("Nonce: %d", new_block.nonce)
         
         # Add the mined block to the blockchain
-        new_block.hash = new_block.calculate_hash()
+        new_block.hash = block_hash
         self.chain.append(new_block)
+        self.transaction_ids.add(reward_transaction.transaction_id)
         
-        # Clear pending transactions 
-        self.pending_transactions = []
+        # Remove the mined transactions from the pending pool; any that
+        # arrived during mining stay queued for the next block
+        self.remove_pending_transactions({tx.transaction_id for tx in all_transactions})
         
         #Update UTXO set to reflect new block
-        self.update_utxo_set()
+        self._apply_block_to_utxo(new_block)
         
         # Adjust difficulty based on mining time
         self.adjust_difficulty()
         
         return new_block
     
+    def parallel_mine(self, miner_address: str) -> Optional[Block]:
+        """Mine a new block, searching nonces on all CPU cores"""
+        return self.mine_block(miner_address, parallel=True)
+    
+    def rebuild_transaction_index(self):
+        """Rebuild the set of known transaction IDs from the chain and mempool"""
+        self.transaction_ids = {tx.transaction_id for block in self.chain for tx in block.transactions}
+        self.transaction_ids.update(tx.transaction_id for tx in self.pending_transactions)
+    
+    def rebuild_mempool_index(self):
+        """Rebuild the lookup tables derived from pending_transactions"""
+        self.pending_delta = {}
+        for tx in self.pending_transactions:
+            self._apply_to_balances(self.pending_delta, tx)
+        self.pending_senders = {tx.sender for tx in self.pending_transactions}
+    
     def update_utxo_set(self):
-        """Update the UTXO set based on current chain state"""
+        """Rebuild the UTXO set and confirmed balances from the whole chain"""
         self.utxo_set = {}
+        self.balances = {}
         for block in self.chain:
-            for tx in block.transactions:
-                if tx.recipient not in self.utxo_set:
-                    self.utxo_set[tx.recipient] = 0
-                self.utxo_set[tx.recipient] += tx.amount
+            self._apply_block_to_utxo(block)
+    
+    def _apply_block_to_utxo(self, block: Block, utxo_set: Optional[Dict[str, float]] = None,
+                             balances: Optional[Dict[str, int]] = None):
+        """
+        Apply the transactions of a newly appended block to the UTXO set and balances.
+        
+        Args:
+            block (Block): The appended block
+            utxo_set, balances: Tables to update (default: this chain's own)
+        """
+        if utxo_set is None:
+            utxo_set, balances = self.utxo_set, self.balances
+        for tx in block.transactions:
+            utxo_set[tx.recipient] = utxo_set.get(tx.recipient, 0) + tx.amount
+            self._apply_to_balances(balances, tx)
     
     def adjust_difficulty(self):
        
         if len(self.chain) < 2:  # Need at least 2 blocks to calculate time difference
             return
         
-        current_time = time.time()
+        current_time = time.monotonic()
         if self.last_mining_time > 0:
             time_diff = current_time - self.last_mining_time
             
             if time_diff < self.target_block_time * 0.5:  # Too fast
                 self.difficulty += 1
-                print(f"Difficulty increased to {self.difficulty} (blocks too fast)")
+                logger.info("Difficulty increased to %d (blocks too fast)", self.difficulty)
             elif time_diff > self.target_block_time * 2.0:  # Too slow
                 self.difficulty = max(1, self.difficulty - 1)  # Don't go below 1
-                print(f"Difficulty decreased to {self.difficulty} (blocks too slow)")
+                logger.info("Difficulty decreased to %d (blocks too slow)", self.difficulty)
         
         self.last_mining_time = current_time
     
@@ -574,22 +1289,22 @@ class Blockchain:
             current_block = self.chain[i]
             previous_block = self.chain[i - 1]
             
-            # Check 1: Verify current block hash is correct
+            # Check 1: Verify current block hash is correct. Blocks are hashed
+            # one at a time so the first bad block ends the walk
             if current_block.calculate_hash() != current_block.hash:
-                print(f"Invalid hash in block {i}")
+                logger.warning("Invalid hash in block %d", i)
                 return False
             
             # Check 2: Verify chain linking is correct
             # Each block must point to the previous block's hash
             if current_block.previous_hash != previous_block.hash:
-                print(f"Invalid previous hash in block {i}")
+                logger.warning("Invalid previous hash in block %d", i)
                 return False
             
             # Check 3: Verify Proof-of-Work consensus
             # Block hash must meet the difficulty requirement
-            target = "0" * current_block.difficulty
-            if not current_block.hash.startswith(target):
-                print(f"Block {i} doesn't meet difficulty requirement")
+            if not meets_difficulty(current_block.hash, current_block.difficulty):
+                logger.warning("Block %d doesn't meet difficulty requirement", i)
                 return False
         
         # All checks passed - blockchain is valid
@@ -599,7 +1314,8 @@ class Blockchain:
         """Add a block to the chain (for P2P networking)"""
         if self.is_block_valid(block):
             self.chain.append(block)
-            self.update_utxo_set()
+            self.transaction_ids.update(tx.transaction_id for tx in block.transactions)
+            self._apply_block_to_utxo(block)
             return True
         return False
     
@@ -610,8 +1326,7 @@ class Blockchain:
             return False
         
         # Check if block hash meets difficulty
-        target = "0" * block.difficulty
-        if not block.hash.startswith(target):
+        if not meets_difficulty(block.hash, block.difficulty):
             return False
         
         # Check if block hash is correct
@@ -620,26 +1335,108 @@ class Blockchain:
         
         return True
     
-    def save_to_file(self, filename: str = "blockchain.pkl"):
-        """Save blockchain to file"""
+    @staticmethod
+    def block_log_path(filename: str) -> str:
+        """Path of the append-only block log that belongs to a state file"""
+        return os.path.splitext(filename)[0] + ".jsonl"
+    
+    def _write_block_log(self, path: str):
+        """
+        Write the chain to its block log, one JSON line per block.
+        
+        If this chain was saved to the same log before and still extends what
+        was written, only the new blocks are appended; otherwise (first save,
+        or the chain was replaced) the log is rewritten. Each log path keeps
+        its own append state, so saves to several logs (e.g. save_to_file and
+        snapshot) all stay incremental.
+        
+        Args:
+            path (str): Block log path
+        """
+        written = 0
+        offsets = []
+        if path in self._block_logs:
+            count, last_hash, size, offsets = self._block_logs[path]
+            if (count <= len(self.chain)
+                    and self.chain[count - 1].hash == last_hash
+                    and os.path.exists(path) and os.path.getsize(path) == size):
+                written = count
+        
+        if not written:
+            offsets = []
+        with open(path, 'ab' if written else 'wb') as f:
+            for block in self.chain[written:]:
+                offsets.append(f.tell())
+                f.write(orjson.dumps(dict(block.to_dict(), hash=block.hash)) + b"\n")
+            size = f.tell()
+        self._block_logs[path] = (len(self.chain), self.chain[-1].hash, size, offsets)
+        self._block_log_path = path
+    
+    def read_block_from_log(self, index: int) -> Block:
+        """
+        Read one block back from the block log without loading the rest.
+        
+        Args:
+            index (int): Block index in the chain
+            
+        Returns:
+            Block: The block as last saved to the log
+        """
+        if self._block_log_path is None:
+            raise ValueError("Blockchain has not been saved to or loaded from a block log")
+        with open(self._block_log_path, 'rb') as f:
+            f.seek(self._block_logs[self._block_log_path][3][index])
+            return Block.from_dict(orjson.loads(f.readline()))
+    
+    def save_to_file(self, filename: str = "blockchain.json"):
+        """
+        Save blockchain to file.
+        
+        Blocks go to an append-only log next to the file (blockchain.jsonl
+        for blockchain.json), so each save only writes blocks mined since the
+        last one. The file itself holds the small mutable state: difficulty,
+        pending transactions and wallets.
+        """
         try:
+            self._write_block_log(self.block_log_path(filename))
+            data = {
+                'difficulty': self.difficulty,
+                'pending_transactions': [dict(tx.to_dict(), signature=tx.signature)
+                                         for tx in self.pending_transactions],
+                'wallets': [wallet.to_dict() for wallet in self.wallets.values()]
+            }
             with open(filename, 'wb') as f:
-                pickle.dump(self, f)
+                f.write(orjson.dumps(data))
             print(f"Blockchain saved to {filename}")
         except Exception as e:
             print(f"Error saving blockchain: {e}")
     
-    def load_from_file(self, filename: str = "blockchain.pkl") -> bool:
-        """Load blockchain from file"""
+    def load_from_file(self, filename: str = "blockchain.json") -> bool:
+        """
+        Load blockchain from file and its block log.
+        
+        Everything is parsed before any state is replaced, so a missing,
+        empty or corrupt file leaves the current chain untouched.
+        """
         try:
-            if os.path.exists(filename):
+            log_path = self.block_log_path(filename)
+            if os.path.exists(filename) and os.path.exists(log_path):
                 with open(filename, 'rb') as f:
-                    loaded_blockchain = pickle.load(f)
-                    self.chain = loaded_blockchain.chain
-                    self.pending_transactions = loaded_blockchain.pending_transactions
-                    self.difficulty = loaded_blockchain.difficulty
-                    self.utxo_set = loaded_blockchain.utxo_set
-                    self.wallets = loaded_blockchain.wallets
+                    data = orjson.loads(f.read())
+                
+                chain, offsets, size, utxo_set, balances = self._read_block_log(log_path, apply_utxo=True)
+                pending_transactions = [Transaction.from_dict(tx) for tx in data['pending_transactions']]
+                wallets = {wallet['name']: Wallet.from_dict(wallet) for wallet in data['wallets']}
+                difficulty = data['difficulty']
+                
+                self._adopt_block_log(log_path, chain, offsets, size)
+                self.utxo_set, self.balances = utxo_set, balances
+                self.pending_transactions = pending_transactions
+                self.difficulty = difficulty
+                self.wallets = wallets
+                self._pubkeys = {}
+                self.rebuild_transaction_index()
+                self.rebuild_mempool_index()
                 print(f"Blockchain loaded from {filename}")
                 return True
             return False
@@ -647,39 +1444,196 @@ class Blockchain:
             print(f"Error loading blockchain: {e}")
             return False
     
-    def print_chain(self):
-        """Print the entire blockchain"""
-        print("\n" + "="*50)
-        print("BLOCKCHAIN")
-        print("="*50)
+    def _read_block_log(self, path: str, apply_utxo: bool) -> tuple:
+        """
+        Parse a block log without changing this chain.
         
-        for block in self.chain:
-            print(f"\nBlock #{block.index}")
-            print(f"Timestamp: {time.ctime(block.timestamp)}")
-            print(f"Previous Hash: {block.previous_hash[:20]}...")
-            print(f"Hash: {block.hash[:20]}...")
-            print(f"Nonce: {block.nonce}")
-            print(f"Difficulty: {block.difficulty}")
-            print(f"Transactions: {len(block.transactions)}")
+        Args:
+            path (str): Block log path
+            apply_utxo (bool): Rebuild the UTXO set and balances while streaming
+            
+        Returns:
+            tuple: (blocks, line offsets, file size, UTXO set, balances); the
+            last two are None unless apply_utxo
+            
+        Raises:
+            ValueError: If the log holds no blocks
+        """
+        chain = []
+        offsets = []
+        utxo_set, balances = ({}, {}) if apply_utxo else (None, None)
+        offset = 0
+        with open(path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    block = Block.from_dict(orjson.loads(line))
+                    chain.append(block)
+                    offsets.append(offset)
+                    if apply_utxo:
+                        self._apply_block_to_utxo(block, utxo_set, balances)
+                offset += len(line)
+        if not chain:
+            raise ValueError(f"Block log {path} is empty")
+        return chain, offsets, offset, utxo_set, balances
+    
+    def _adopt_block_log(self, path: str, chain: List[Block], offsets: List[int], size: int):
+        """Make a chain read by _read_block_log this chain, remembering where it was read from"""
+        self.chain = chain
+        self._block_logs[path] = (len(chain), chain[-1].hash, size, offsets)
+        self._block_log_path = path
+    
+    # -------------------------------------------------------------------------
+    # Split snapshots - chain, UTXO set, wallets and mempool in separate files
+    # -------------------------------------------------------------------------
+    
+    def save_chain(self, path: str):
+        """Append new blocks to the block log at path"""
+        self._write_block_log(path)
+    
+    def save_utxos(self, path: str):
+        """Write the UTXO set and confirmed balances, tagged with the chain tip"""
+        data = {
+            'tip': self.chain[-1].hash,
+            'utxo_set': self.utxo_set,
+            'balances': self.balances
+        }
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data))
+    
+    def save_wallets(self, path: str):
+        """Write all wallets (including private keys)"""
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps([wallet.to_dict() for wallet in self.wallets.values()]))
+    
+    def save_mempool(self, path: str):
+        """Write the difficulty and pending transactions"""
+        data = {
+            'difficulty': self.difficulty,
+            'pending_transactions': [dict(tx.to_dict(), signature=tx.signature)
+                                     for tx in self.pending_transactions]
+        }
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data))
+    
+    def snapshot(self, directory: str):
+        """
+        Save the blockchain to a directory, writing only what changed.
+        
+        The block log only gets new blocks appended, the UTXO file is only
+        rewritten when the chain tip moved, and wallets only when a wallet
+        was added or removed since the last snapshot to this directory.
+        The small mempool file is always rewritten.
+        
+        Args:
+            directory (str): Snapshot directory (created if missing)
+        """
+        os.makedirs(directory, exist_ok=True)
+        tip = self.chain[-1].hash
+        wallet_names = frozenset(self.wallets)
+        last_dir, last_tip, last_wallets = self._snapshot or (None, None, None)
+        same_dir = last_dir == directory
+        
+        self.save_chain(os.path.join(directory, "chain.jsonl"))
+        if not same_dir or tip != last_tip:
+            self.save_utxos(os.path.join(directory, "utxos.json"))
+        if not same_dir or wallet_names != last_wallets:
+            self.save_wallets(os.path.join(directory, "wallets.json"))
+        self.save_mempool(os.path.join(directory, "mempool.json"))
+        self._snapshot = (directory, tip, wallet_names)
+    
+    def load_snapshot(self, directory: str) -> bool:
+        """
+        Load a blockchain saved with snapshot.
+        
+        The UTXO file is used as-is when it matches the chain tip; otherwise
+        the UTXO set is rebuilt while the block log is read.
+        
+        Args:
+            directory (str): Snapshot directory
+            
+        Returns:
+            bool: True if the snapshot was loaded
+        """
+        chain_path = os.path.join(directory, "chain.jsonl")
+        utxo_path = os.path.join(directory, "utxos.json")
+        if not os.path.exists(chain_path):
+            return False
+        
+        utxos = None
+        if os.path.exists(utxo_path):
+            with open(utxo_path, 'rb') as f:
+                utxos = orjson.loads(f.read())
+        
+        # Parse every file before replacing any state
+        chain, offsets, size, utxo_set, balances = self._read_block_log(chain_path, apply_utxo=utxos is None)
+        with open(os.path.join(directory, "wallets.json"), 'rb') as f:
+            wallets = {wallet['name']: Wallet.from_dict(wallet) for wallet in orjson.loads(f.read())}
+        with open(os.path.join(directory, "mempool.json"), 'rb') as f:
+            mempool = orjson.loads(f.read())
+        pending_transactions = [Transaction.from_dict(tx) for tx in mempool['pending_transactions']]
+        
+        self._adopt_block_log(chain_path, chain, offsets, size)
+        if utxos is None:
+            self.utxo_set, self.balances = utxo_set, balances
+        elif utxos['tip'] == chain[-1].hash:
+            self.utxo_set = {sys.intern(address): amount for address, amount in utxos['utxo_set'].items()}
+            self.balances = {sys.intern(address): amount for address, amount in utxos['balances'].items()}
+        else:
+            self.update_utxo_set()
+        self.wallets = wallets
+        self.difficulty = mempool['difficulty']
+        self.pending_transactions = pending_transactions
+        self._pubkeys = {}
+        self.rebuild_transaction_index()
+        self.rebuild_mempool_index()
+        self._snapshot = (directory, self.chain[-1].hash, frozenset(self.wallets))
+        return True
+    
+    def print_chain(self, file=None, limit: Optional[int] = 50):
+        """
+        Print the blockchain.
+        
+        The output is built in memory and written with a single call.
+        
+        Args:
+            file: Text stream to write to (default: sys.stdout)
+            limit (Optional[int]): Show only the most recent blocks (None for all)
+        """
+        blocks = self.chain if limit is None else self.chain[-limit:]
+        lines = ["\n" + "="*50, "BLOCKCHAIN", "="*50]
+        if len(blocks) < len(self.chain):
+            lines.append(f"(showing last {len(blocks)} of {len(self.chain)} blocks)")
+        
+        for block in blocks:
+            lines.append(f"\nBlock #{block.index}")
+            lines.append(f"Timestamp: {time.ctime(block.timestamp)}")
+            lines.append(f"Previous Hash: {block.previous_hash[:20]}...")
+            lines.append(f"Hash: {block.hash[:20]}...")
+            lines.append(f"Nonce: {block.nonce}")
+            lines.append(f"Difficulty: {block.difficulty}")
+            lines.append(f"Transactions: {len(block.transactions)}")
             
             for tx in block.transactions:
-                print(f"  {tx.sender} -> {tx.recipient}: {tx.amount}")
+                lines.append(f"  {tx.sender} -> {tx.recipient}: {tx.amount}")
         
-        print(f"\nChain length: {len(self.chain)}")
-        print(f"Pending transactions: {len(self.pending_transactions)}")
-        print("="*50)
+        lines.append(f"\nChain length: {len(self.chain)}")
+        lines.append(f"Pending transactions: {len(self.pending_transactions)}")
+        lines.append("="*50)
+        (file or sys.stdout).write("\n".join(lines) + "\n")
     
-    def print_balances(self):
-        """Print all wallet balances"""
-        print("\n" + "="*30)
-        print("WALLET BALANCES")
-        print("="*30)
+    def print_balances(self, file=None):
+        """
+        Print all wallet balances.
         
+        Args:
+            file: Text stream to write to (default: sys.stdout)
+        """
+        lines = ["\n" + "="*30, "WALLET BALANCES", "="*30]
         for wallet_name in self.wallets:
             balance = self.get_balance(wallet_name)
-            print(f"{wallet_name}: {balance}")
-        
-        print("="*30)
+            lines.append(f"{wallet_name}: {balance}")
+        lines.append("="*30)
+        (file or sys.stdout).write("\n".join(lines) + "\n")
 
     def demonstrate_immutability(self) -> bool:
         """
@@ -785,8 +1739,7 @@ class Blockchain:
             print(f"     - Hash validation: {'✓ Valid' if hash_valid else '✗ Invalid'}")
             
             # Validate Proof-of-Work
-            target = "0" * block.difficulty
-            pow_valid = block.hash.startswith(target)
+            pow_valid = meets_difficulty(block.hash, block.difficulty)
             print(f"     - Proof-of-Work: {'✓ Valid' if pow_valid else '✗ Invalid'}")
             
             # Validate chain linking (except genesis)
@@ -815,10 +1768,16 @@ class Blockchain:
         print(f"\n4. Merkle root validation:")
         for block in self.chain:
             if block.transactions:
-                calculated_merkle = self.calculate_merkle_root(block.transactions)
+                calculated_merkle = block.calculate_merkle_root()
                 merkle_valid = block.merkle_root == calculated_merkle
                 print(f"   - Block #{block.index} Merkle root: {'✓ Valid' if merkle_valid else '✗ Invalid'}")
         
+        print(f"\n5. Signature validation:")
+        for block in self.chain:
+            if block.transactions:
+                signatures_valid = self.verify_block(block)
+                print(f"   - Block #{block.index} signatures: {'✓ Valid' if signatures_valid else '✗ Invalid'}")
+        
         print("\n" + "="*60)
         print("           VALIDATION DEMONSTRATION COMPLETE")
         print("="*60)
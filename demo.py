@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+import logging
+import sys
 from blockchain import Blockchain, Wallet
 
 def demo_double_spend_prevention():
@@ -78,4 +80,5 @@ def demo_double_spend_prevention():
     return blockchain
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     demo_double_spend_prevention()
@@ -41,8 +41,10 @@ FEATURES:
 import sys
 import time
 import os
+import logging
 from blockchain import Blockchain, Wallet
-from p2p_network import P2PNode
+
+CHAIN_PAGE_SIZE = 50   # Blocks shown by "view blockchain" unless all are requested
 
 class BlockchainCLI:
     """Command-line interface for the blockchain system"""
@@ -62,9 +64,9 @@ class BlockchainCLI:
         
         # Try to load existing blockchain or create new one
         self.blockchain = Blockchain(difficulty=4)
-        if not self.blockchain.load_from_file("blockchain.pkl"):
+        if not self.blockchain.load_from_file("blockchain.json"):
             print("No existing blockchain found. Creating new blockchain...")
-            self.blockchain.save_to_file("blockchain.pkl")
+            self.blockchain.save_to_file("blockchain.json")
         
         # Initialize wallets if they don't exist
         if not self.blockchain.wallets:
@@ -101,14 +103,16 @@ class BlockchainCLI:
         if genesis_tx and genesis_tx2 and genesis_tx3:
             print("Mining genesis block with initial transactions...")
             self.blockchain.mine_block("Alice")
-            self.blockchain.save_to_file("blockchain.pkl")
-            print("✓ Genesis block saved to blockchain.pkl")
+            self.blockchain.save_to_file("blockchain.json")
+            print("✓ Genesis block saved to blockchain.json")
         
         print("Wallets initialized successfully!")
     
     def start_p2p_network(self):
         """Start the P2P networking component"""
         try:
+            # Networking is imported on first use so other commands start faster
+            from p2p_network import P2PNode
             self.p2p_node = P2PNode("localhost", 5000, self.blockchain)
             self.p2p_node.start()
             print("P2P networking started on localhost:5000")
@@ -180,8 +184,13 @@ class BlockchainCLI:
         return True
     
     def view_blockchain(self):
-        """Display the entire blockchain"""
-        self.blockchain.print_chain()
+        """Display the blockchain, asking before printing very long chains"""
+        limit = CHAIN_PAGE_SIZE
+        if len(self.blockchain.chain) > CHAIN_PAGE_SIZE:
+            answer = input(f"Chain has {len(self.blockchain.chain)} blocks. Show all? (y/N): ").strip().lower()
+            if answer == 'y':
+                limit = None
+        self.blockchain.print_chain(limit=limit)
     
     def view_balances(self):
         """Display all wallet balances"""
@@ -193,16 +202,17 @@ class BlockchainCLI:
         
         # Show available wallets
         print("Available wallets:")
-        for i, wallet_name in enumerate(self.blockchain.wallets.keys(), 1):
+        wallet_names = list(self.blockchain.wallets.keys())
+        for i, wallet_name in enumerate(wallet_names, 1):
             balance = self.blockchain.get_balance(wallet_name)
             print(f"{i}. {wallet_name} (Balance: {balance})")
         
         try:
             sender_idx = int(input("Select sender wallet (number): ")) - 1
-            sender_name = list(self.blockchain.wallets.keys())[sender_idx]
+            sender_name = wallet_names[sender_idx]
             
             recipient_idx = int(input("Select recipient wallet (number): ")) - 1
-            recipient_name = list(self.blockchain.wallets.keys())[recipient_idx]
+            recipient_name = wallet_names[recipient_idx]
             
             amount = float(input("Enter amount: "))
             
@@ -214,16 +224,11 @@ class BlockchainCLI:
             sender_wallet = self.blockchain.wallets[sender_name]
             
             # Create and add transaction
-            if self.blockchain.add_transaction(sender_name, recipient_name, amount, sender_wallet):
+            tx = self.blockchain.add_transaction(sender_name, recipient_name, amount, sender_wallet)
+            if tx:
                 print("Transaction created successfully!")
                 if self.p2p_node:
-                    # Find the transaction we just created
-                    for tx in self.blockchain.pending_transactions:
-                        if (tx.sender == sender_name and 
-                            tx.recipient == recipient_name and 
-                            tx.amount == amount):
-                            self.p2p_node.broadcast_transaction(tx)
-                            break
+                    self.p2p_node.broadcast_transaction(tx)
             else:
                 print("Failed to create transaction!")
                 
@@ -269,7 +274,7 @@ class BlockchainCLI:
         print("Mining... (this may take a moment)")
         
         start_time = time.time()
-        new_block = self.blockchain.mine_block(miner_address)
+        new_block = self.blockchain.parallel_mine(miner_address)
         mining_time = time.time() - start_time
         
         if new_block:
@@ -309,8 +314,8 @@ class BlockchainCLI:
             print(f"Current difficulty: {self.blockchain.difficulty}")
             
             # Save blockchain after successful mining
-            self.blockchain.save_to_file("blockchain.pkl")
-            print("✓ Blockchain saved to blockchain.pkl")
+            self.blockchain.save_to_file("blockchain.json")
+            print("✓ Blockchain saved to blockchain.json")
         else:
             print("Failed to mine block.")
     
@@ -375,11 +380,11 @@ class BlockchainCLI:
             peer_address = input("Enter peer address to remove: ").strip()
             self.p2p_node.remove_peer(peer_address)
         elif choice == "3":
-            peers = list(self.p2p_node.peers)
+            peers = self.p2p_node.peer_snapshot
             if peers:
                 print("Connected peers:")
-                for peer in peers:
-                    print(f"  - {peer}")
+                for host, port in peers:
+                    print(f"  - {host}:{port}")
             else:
                 print("No peers connected")
         elif choice == "4":
@@ -401,15 +406,15 @@ class BlockchainCLI:
         choice = input("Enter choice: ").strip()
         
         if choice == "1":
-            filename = input("Enter filename (default: blockchain.pkl): ").strip()
+            filename = input("Enter filename (default: blockchain.json): ").strip()
             if not filename:
-                filename = "blockchain.pkl"
+                filename = "blockchain.json"
             self.blockchain.save_to_file(filename)
             print(f"✓ Blockchain saved to {filename}")
         elif choice == "2":
-            filename = input("Enter filename to load (default: blockchain.pkl): ").strip()
+            filename = input("Enter filename to load (default: blockchain.json): ").strip()
             if not filename:
-                filename = "blockchain.pkl"
+                filename = "blockchain.json"
             if self.blockchain.load_from_file(filename):
                 print(f"✓ Blockchain loaded successfully from {filename}!")
             else:
@@ -462,13 +467,15 @@ class BlockchainCLI:
             self.p2p_node.stop()
         
         if self.blockchain:
-            self.blockchain.save_to_file("blockchain.pkl")
-            print("✓ Blockchain saved to blockchain.pkl")
+            self.blockchain.save_to_file("blockchain.json")
+            print("✓ Blockchain saved to blockchain.json")
         
         print("Cleanup complete. Goodbye!")
 
 def main():
     """Main entry point"""
+    # Show the blockchain's status messages on the console
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     try:
         cli = BlockchainCLI()
         cli.start()
@@ -0,0 +1,162 @@
+# =============================================================================
+# PROOF-OF-WORK MINING MODULE - INTE264 Assignment 2
+# =============================================================================
+# This module contains the nonce search used to mine new blocks.
+#
+# A block hash is SHA-256(header_prefix + nonce), where header_prefix is the
+# serialized block without its nonce. Only the nonce changes between mining
+# attempts, so the prefix is built and hashed once per block (the SHA-256
+# "midstate") and every attempt only hashes the nonce on top of it.
+# =============================================================================
+
+import hashlib         # For SHA-256 cryptographic hashing
+import os              # For the CPU count
+from typing import Optional, Tuple  # Type hints for better code clarity
+
+NONCE_SIZE = 8         # Nonce is appended as an 8-byte little-endian integer
+
+# Blocks with at least this difficulty are mined on all CPU cores; easier
+# targets are found faster than worker processes can start
+PARALLEL_MINING_MIN_DIFFICULTY = 5
+
+# Nonces each worker tries between checks of the shared stop flag
+STOP_CHECK_INTERVAL = 4096
+
+def pack_nonce(nonce: int) -> bytes:
+    """
+    Encode a nonce the way it is appended to the block header.
+
+    Args:
+        nonce (int): Proof-of-Work number
+
+    Returns:
+        bytes: 8-byte little-endian encoding of the nonce
+    """
+    return nonce.to_bytes(NONCE_SIZE, 'little')
+
+
+def meets_difficulty(block_hash: str, difficulty: int) -> bool:
+    """
+    Check a hex block hash against the difficulty target.
+
+    Args:
+        block_hash (str): 64-character hex block hash
+        difficulty (int): Number of leading hex zeros required
+
+    Returns:
+        bool: True if the top 4 * difficulty bits of the hash are zero
+    """
+    return int(block_hash, 16) >> (256 - 4 * difficulty) == 0
+
+
+def find_nonce(header_prefix: bytes, difficulty: int, start: int = 0) -> Tuple[int, str]:
+    """
+    Search for a nonce whose block hash meets the difficulty target.
+
+    Args:
+        header_prefix (bytes): Serialized block without the nonce
+        difficulty (int): Number of leading hex zeros required
+        start (int): First nonce to try
+
+    Returns:
+        Tuple[int, str]: The winning nonce and the resulting block hash
+    """
+    # A hash meets the target when its top 4 * difficulty bits are zero: the
+    # first difficulty // 2 raw bytes are zero and, for an odd difficulty,
+    # the high nibble of the next byte is zero as well
+    zero_bytes = difficulty // 2
+    zero_prefix = bytes(zero_bytes)
+    odd_nibble = difficulty % 2
+    
+    # Hash the fixed prefix once; each attempt resumes from this midstate and
+    # only compresses the final block(s) that contain the nonce
+    copy = hashlib.sha256(header_prefix).copy
+    nonce = start
+    while True:
+        h = copy()
+        h.update(nonce.to_bytes(NONCE_SIZE, 'little'))
+        digest = h.digest()
+        if digest[:zero_bytes] == zero_prefix and not (odd_nibble and digest[zero_bytes] >= 0x10):
+            # Hex-encode only the winning hash
+            return nonce, digest.hex()
+        nonce += 1
+
+
+def _mine_range(header_prefix: bytes, difficulty: int, start: int, stride: int,
+                stop_event, result_queue) -> None:
+    """
+    Worker process: try nonces start, start + stride, start + 2 * stride, ...
+
+    The first worker to find a valid nonce puts (nonce, hash) on the result
+    queue and sets the stop event so the other workers give up.
+
+    Args:
+        header_prefix (bytes): Serialized block without the nonce
+        difficulty (int): Number of leading hex zeros required
+        start (int): First nonce this worker tries
+        stride (int): Distance between consecutive nonces of this worker
+        stop_event: Shared multiprocessing.Event set once a nonce is found
+        result_queue: Shared multiprocessing.Queue receiving the result
+    """
+    zero_bytes = difficulty // 2
+    zero_prefix = bytes(zero_bytes)
+    odd_nibble = difficulty % 2
+    
+    copy = hashlib.sha256(header_prefix).copy
+    nonce = start
+    while not stop_event.is_set():
+        # Only check the shared flag once per batch of attempts
+        for _ in range(STOP_CHECK_INTERVAL):
+            h = copy()
+            h.update(nonce.to_bytes(NONCE_SIZE, 'little'))
+            digest = h.digest()
+            if digest[:zero_bytes] == zero_prefix and not (odd_nibble and digest[zero_bytes] >= 0x10):
+                if not stop_event.is_set():
+                    stop_event.set()
+                    result_queue.put((nonce, digest.hex()))
+                return
+            nonce += stride
+
+
+def find_nonce_parallel(header_prefix: bytes, difficulty: int, start: int = 0,
+                        workers: Optional[int] = None) -> Tuple[int, str]:
+    """
+    Search for a valid nonce on several CPU cores.
+
+    Worker k tries nonces start + k, start + k + workers, ... so the ranges
+    never overlap. The result is a valid nonce, but not necessarily the
+    smallest one.
+
+    Args:
+        header_prefix (bytes): Serialized block without the nonce
+        difficulty (int): Number of leading hex zeros required
+        start (int): First nonce to try
+        workers (Optional[int]): Number of worker processes (default: CPU count)
+
+    Returns:
+        Tuple[int, str]: The winning nonce and the resulting block hash
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers < 2:
+        return find_nonce(header_prefix, difficulty, start)
+    
+    import multiprocessing  # Only needed for parallel mining; import on first use
+    
+    stop_event = multiprocessing.Event()
+    result_queue = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(
+            target=_mine_range,
+            args=(header_prefix, difficulty, start + k, workers, stop_event, result_queue),
+            daemon=True,
+        )
+        for k in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        return result_queue.get()
+    finally:
+        stop_event.set()
+        for process in processes:
+            process.join()
@@ -14,18 +14,106 @@
 #
 # NETWORK PROTOCOL:
 # - TCP-based communication for reliability
-# - JSON message format for easy parsing
-# - Threaded message handling for concurrency
+# - JSON messages (orjson), each framed by a 4-byte big-endian length prefix
+#   and a 1-byte message type tag
+# - One asyncio event loop (on a background thread) serves all connections
+# - Outbound connections to peers are kept open and reused across messages
+# - Gossip: a message goes to about sqrt(N) random peers, and every node
+#   relays transactions and blocks that are new to it
 # - Automatic peer management and cleanup
 # =============================================================================
 
+import asyncio         # For the event loop serving peer connections
 import socket          # For network communication
-import threading       # For concurrent message handling
-import json            # For message serialization
+import threading       # For the event loop thread and peer list lock
+import math            # For the gossip fan-out
+import random          # For picking gossip targets
+from concurrent.futures import Future, ThreadPoolExecutor  # For whole-chain work off the event loop
+import orjson          # For fast message serialization
 import time            # For timing and delays
-from typing import List, Dict, Set  # Type hints for better code clarity
+from typing import List, Dict, Optional, Set, Tuple  # Type hints for better code clarity
 from blockchain import Blockchain, Block, Transaction  # Core blockchain classes
 
+FRAME_HEADER_SIZE = 4  # Bytes in the big-endian length prefix of every message
+MAX_FRAME_SIZE = 32 << 20  # Largest frame accepted from a peer (32 MiB)
+MAX_CHAIN_LEAD = 10000  # Most blocks a peer's chain may be ahead of ours in one sync
+MAX_CHAIN_DOWNLOAD = 512 << 20  # Most block bytes read from a peer in one sync (512 MiB)
+
+# Message types in wire tag order; a frame's first payload byte is the index
+# of its type, so receivers can route a message before decoding its JSON
+MESSAGE_TYPES = ('new_transaction', 'new_block', 'chain_request', 'peer_discovery')
+MESSAGE_TAGS = {message_type: tag for tag, message_type in enumerate(MESSAGE_TYPES)}
+PeerAddress = Tuple[str, int]  # (host, port) of a peer
+
+OUTBOX_BATCH_SIZE = 100  # Most queued frames written to a peer in one go
+GOSSIP_MIN_FANOUT = 3  # Fewest peers a gossiped message is sent to
+KEEPALIVE_IDLE = 30  # Seconds a pooled connection may sit idle before TCP probes the peer
+
+def encode_message(message: Dict) -> bytes:
+    """Serialize a message and prepend its length prefix and type tag"""
+    payload = orjson.dumps(message)
+    tag = MESSAGE_TAGS.get(message['type'], 255)  # 255: type unknown to this version
+    return (len(payload) + 1).to_bytes(FRAME_HEADER_SIZE, 'big') + bytes((tag,)) + payload
+
+async def read_sized(reader: asyncio.StreamReader) -> bytes:
+    """
+    Read one length-prefixed frame from a stream.
+    
+    The length comes from the peer, so it is checked before anything is
+    buffered; a larger frame raises ValueError and the caller drops the
+    connection.
+    
+    Returns:
+        bytes: Frame contents, without the length prefix
+    """
+    size = int.from_bytes(await reader.readexactly(FRAME_HEADER_SIZE), 'big')
+    if size > MAX_FRAME_SIZE:
+        raise ValueError(f"frame of {size} bytes exceeds the {MAX_FRAME_SIZE} byte limit")
+    return await reader.readexactly(size)
+
+async def read_frame(reader: asyncio.StreamReader) -> Tuple[Optional[str], bytes]:
+    """
+    Read one framed message from a stream without decoding it.
+    
+    Returns:
+        Tuple[Optional[str], bytes]: Message type (None if unknown) and JSON payload
+    """
+    frame = await read_sized(reader)
+    tag = frame[0]
+    message_type = MESSAGE_TYPES[tag] if tag < len(MESSAGE_TYPES) else None
+    return message_type, frame[1:]
+
+def parse_peer_address(address: str) -> PeerAddress:
+    """Split "host:port" into (host, port); rsplit keeps IPv6 hosts intact"""
+    host, port = address.rsplit(':', 1)
+    return host, int(port)
+
+def tune_socket(sock):
+    """
+    Apply the node's TCP options to a socket.
+    
+    Messages are written whole, so Nagle's algorithm would only delay small
+    ones (transactions, peer lists). Buffer sizes are left to the kernel's
+    autotuning. Pooled connections stay open for the life of the peer, so
+    TCP keepalive probes detect peers that vanished without closing them.
+    """
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    if hasattr(socket, 'TCP_KEEPIDLE'):  # Linux; other platforms keep the system default
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE)
+
+async def open_stream(host: str, port: int) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Open a tuned TCP connection to a peer"""
+    reader, writer = await asyncio.open_connection(host, port)
+    tune_socket(writer.get_extra_info('socket'))
+    return reader, writer
+
+def send_frame(host: str, port: int, frame: bytes):
+    """Open a connection, send one framed message and close it"""
+    with socket.create_connection((host, port)) as client_socket:
+        tune_socket(client_socket)
+        client_socket.sendall(frame)
+
 class P2PNode:
     """Represents a node in the P2P network"""
     
@@ -33,69 +121,149 @@ class P2PNode:
         self.host = host
         self.port = port
         self.blockchain = blockchain
-        self.peers: Set[str] = set()  # Set of peer addresses (host:port)
-        self.server_socket = None
+        # Peer addresses, parsed once when added so sends never re-split them
+        self.peers: Set[PeerAddress] = set()
+        self.peer_snapshot: Tuple[PeerAddress, ...] = ()  # Immutable copy of peers, rebuilt on add/remove
+        self._peers_lock = threading.Lock()  # Guards peers and peer_snapshot
         self.running = False
+        self.loop: Optional[asyncio.AbstractEventLoop] = None  # Event loop serving the node
+        self._loop_thread = None
+        self._server = None  # asyncio.Server accepting peer connections
+        # Open outbound connections, reused across broadcasts (event loop only):
+        # peer address -> future resolving to (StreamReader, StreamWriter)
+        self._connections: Dict[PeerAddress, asyncio.Future] = {}
+        # Frames waiting to be written to each peer, and the task writing them
+        self._outboxes: Dict[PeerAddress, asyncio.Queue] = {}
+        self._writer_tasks: Dict[PeerAddress, asyncio.Task] = {}
+        # Chain requests in flight; the event loop only keeps weak references
+        # to tasks, so without these they could be garbage collected mid-request
+        self._requests: Set[Future] = set()
+        # One worker keeps chain replacements from running concurrently; it
+        # lives as long as the node, so the node can be stopped and restarted
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="p2p-worker")
+        # Encoded frames of our chain's blocks, reused by every chain request
+        # (event loop only); the chain only grows, so most requests encode nothing
+        self._chain_frames: List[bytes] = []
+        self._chain_frames_tip: Optional[str] = None  # Hash of the last block in _chain_frames
         
     def start(self):
         """Start the P2P node"""
-        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.server_socket.bind((self.host, self.port))
-        self.server_socket.listen(5)
+        # A single background thread runs the event loop that accepts peer
+        # connections and delivers broadcasts, instead of one thread per peer
+        self.loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self.loop.run_forever)
+        self._loop_thread.daemon = True
+        self._loop_thread.start()
+        
+        try:
+            # Wait for the bind so errors (e.g. port in use) reach the caller
+            asyncio.run_coroutine_threadsafe(self._start_server(), self.loop).result()
+        except Exception:
+            self._stop_loop()
+            raise
         self.running = True
         
         print(f"P2P Node started on {self.host}:{self.port}")
-        
-        # Start listening for connections
-        listen_thread = threading.Thread(target=self.listen_for_connections)
-        listen_thread.daemon = True
-        listen_thread.start()
     
     def stop(self):
         """Stop the P2P node"""
         self.running = False
-        if self.server_socket:
-            self.server_socket.close()
+        if self.loop is not None:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop).result()
+            self._stop_loop()
         print(f"P2P Node stopped on {self.host}:{self.port}")
     
+    def _stop_loop(self):
+        """Stop the event loop and wait for its thread to exit"""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._loop_thread.join()
+        self.loop.close()
+        self.loop = None
+    
+    async def _shutdown(self):
+        """Close the server, pooled peer connections and open client handlers"""
+        self._server.close()
+        for peer in list(self._connections):
+            self._drop_connection(peer)
+        self._outboxes.clear()
+        self._writer_tasks.clear()
+        
+        # Inbound connections stay open between messages and writer tasks wait
+        # on their outboxes; cancel them all
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _start_server(self):
+        """Bind the listening socket (runs on the event loop)"""
+        self._server = await asyncio.start_server(
+            self.handle_client_connection, self.host, self.port, reuse_address=True
+        )
+        # Accepted connections inherit the listening socket's options
+        for sock in self._server.sockets:
+            tune_socket(sock)
+    
     def add_peer(self, peer_address: str):
         """Add a peer to the network"""
-        if peer_address != f"{self.host}:{self.port}":
-            self.peers.add(peer_address)
+        try:
+            peer = parse_peer_address(peer_address)
+        except ValueError:
+            print(f"Invalid peer address: {peer_address}")
+            return
+        if peer != (self.host, self.port):
+            with self._peers_lock:
+                if peer not in self.peers:
+                    self.peers.add(peer)
+                    self.peer_snapshot = tuple(self.peers)
             print(f"Added peer: {peer_address}")
     
     def remove_peer(self, peer_address: str):
         """Remove a peer from the network"""
-        self.peers.discard(peer_address)
-        print(f"Removed peer: {peer_address}")
+        try:
+            self._discard_peer(parse_peer_address(peer_address))
+        except ValueError:
+            print(f"Invalid peer address: {peer_address}")
     
-    def listen_for_connections(self):
-        """Listen for incoming connections from other nodes"""
-        while self.running:
-            try:
-                client_socket, address = self.server_socket.accept()
-                client_thread = threading.Thread(
-                    target=self.handle_client_connection,
-                    args=(client_socket, address)
-                )
-                client_thread.daemon = True
-                client_thread.start()
-            except Exception as e:
-                if self.running:
-                    print(f"Error accepting connection: {e}")
+    def _discard_peer(self, peer: PeerAddress):
+        """Remove a parsed peer address and release its connection"""
+        with self._peers_lock:
+            if peer in self.peers:
+                self.peers.discard(peer)
+                self.peer_snapshot = tuple(self.peers)
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self._forget_peer, peer)
+        print(f"Removed peer: {peer[0]}:{peer[1]}")
     
-    def handle_client_connection(self, client_socket: socket.socket, address):
-        """Handle incoming connection from a client"""
+    async def handle_client_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Handle incoming connection from a client, one message at a time until it closes"""
+        address = writer.get_extra_info('peername')[:2]  # (host, port), also for IPv6
         try:
-            data = client_socket.recv(4096).decode('utf-8')
-            if data:
-                message = json.loads(data)
-                self.process_message(message, address)
+            while True:
+                try:
+                    message_type, payload = await read_frame(reader)
+                except asyncio.IncompleteReadError as e:
+                    if e.partial:
+                        raise
+                    break  # Peer closed the connection between messages
+                if message_type is None:
+                    continue  # Skip message types this node does not know
+                if message_type == 'chain_request':
+                    # The chain is streamed back on the requesting connection,
+                    # which is used for nothing else
+                    await self.send_chain(writer)
+                    break
+                self.process_payload(payload, address)
+        except asyncio.CancelledError:
+            pass  # Node is shutting down
         except Exception as e:
             print(f"Error handling client connection: {e}")
         finally:
-            client_socket.close()
+            writer.close()
+    
+    def process_payload(self, payload: bytes, address):
+        """Decode a message's JSON payload and process it"""
+        self.process_message(orjson.loads(payload), address)
     
     def process_message(self, message: Dict, address):
         """Process incoming messages from peers"""
@@ -105,223 +273,337 @@ class P2PNode:
             self.handle_new_transaction(message['transaction'])
         elif message_type == 'new_block':
             self.handle_new_block(message['block'])
-        elif message_type == 'chain_request':
-            self.send_chain(address)
-        elif message_type == 'chain_response':
-            self.handle_chain_response(message['chain'])
         elif message_type == 'peer_discovery':
             self.handle_peer_discovery(message['peers'])
     
     def broadcast_transaction(self, transaction: Transaction):
         """Broadcast a new transaction to all peers"""
-        message = {
-            'type': 'new_transaction',
-            'transaction': {
-                'sender': transaction.sender,
-                'recipient': transaction.recipient,
-                'amount': transaction.amount,
-                'transaction_id': transaction.transaction_id,
-                'timestamp': transaction.timestamp,
-                'signature': transaction.signature
+        # Encode once; re-broadcasts of the same transaction reuse the frame
+        if transaction.wire_cache is None:
+            message = {
+                'type': 'new_transaction',
+                'transaction': {
+                    'sender': transaction.sender,
+                    'recipient': transaction.recipient,
+                    'amount': transaction.amount,
+                    'transaction_id': transaction.transaction_id,
+                    'timestamp': transaction.timestamp,
+                    'signature': transaction.signature
+                }
             }
-        }
-        self.broadcast_message(message)
+            transaction.wire_cache = encode_message(message)
+        self.broadcast_frame(transaction.wire_cache)
     
     def broadcast_block(self, block: Block):
         """Broadcast a new block to all peers"""
-        message = {
-            'type': 'new_block',
-            'block': {
-                'index': block.index,
-                'timestamp': block.timestamp,
-                'transactions': [tx.to_dict() for tx in block.transactions],
-                'previous_hash': block.previous_hash,
-                'nonce': block.nonce,
-                'difficulty': block.difficulty,
-                'merkle_root': block.merkle_root,
-                'hash': block.hash
+        # Encode once; re-broadcasts of the same block reuse the frame
+        if block.wire_cache is None:
+            message = {
+                'type': 'new_block',
+                'block': {
+                    'index': block.index,
+                    'timestamp': block.timestamp,
+                    'transactions': [tx.to_dict() for tx in block.transactions],
+                    'previous_hash': block.previous_hash,
+                    'nonce': block.nonce,
+                    'difficulty': block.difficulty,
+                    'merkle_root': block.merkle_root,
+                    'hash': block.hash
+                }
             }
-        }
-        self.broadcast_message(message)
+            block.wire_cache = encode_message(message)
+        self.broadcast_frame(block.wire_cache)
+    
+    def broadcast_message(self, message: Dict, fanout: Optional[int] = None):
+        """
+        Gossip a message to the network.
+        
+        The message is serialized immediately and handed to the event loop,
+        so callers (e.g. the CLI) never wait on a slow peer.
+        
+        Args:
+            message (Dict): Message to send
+            fanout (Optional[int]): Number of random peers to send to
+                (default: max(GOSSIP_MIN_FANOUT, sqrt(peer count)))
+        """
+        self.broadcast_frame(encode_message(message), fanout)
+    
+    def broadcast_frame(self, frame: bytes, fanout: Optional[int] = None):
+        """
+        Gossip an already encoded message frame to a random subset of peers.
+        
+        Peers relay transactions and blocks they had not seen yet, so a
+        message reaches the whole network in O(log N) hops while each node
+        sends it to only about sqrt(N) peers instead of all N.
+        
+        Args:
+            frame (bytes): Encoded message frame
+            fanout (Optional[int]): Number of random peers to send to
+                (default: max(GOSSIP_MIN_FANOUT, sqrt(peer count)))
+        """
+        # The snapshot tuple is immutable, so it is passed on without copying
+        peers = self.peer_snapshot
+        if fanout is None:
+            fanout = max(GOSSIP_MIN_FANOUT, math.isqrt(len(peers)))
+        if fanout < len(peers):
+            peers = tuple(random.sample(peers, fanout))
+        
+        if self.loop is None:
+            # Deliver inline if the node was never started
+            self.send_to_peers(frame, peers)
+        else:
+            self.loop.call_soon_threadsafe(self._enqueue, frame, peers)
+    
+    def _enqueue(self, frame: bytes, peers: Tuple[PeerAddress, ...]):
+        """Queue a frame for each peer, starting its writer task on first use (runs on the event loop)"""
+        for peer in peers:
+            outbox = self._outboxes.get(peer)
+            if outbox is None:
+                outbox = self._outboxes[peer] = asyncio.Queue()
+                self._writer_tasks[peer] = asyncio.ensure_future(self._peer_writer_loop(peer, outbox))
+            outbox.put_nowait(frame)
     
-    def broadcast_message(self, message: Dict):
-        """Broadcast a message to all peers"""
-        message_str = json.dumps(message)
+    async def _peer_writer_loop(self, peer: PeerAddress, outbox: asyncio.Queue):
+        """
+        Deliver queued frames to one peer in order.
         
-        for peer in self.peers:
+        Every frame that piled up while the previous write was in flight is
+        sent together, so e.g. a new block and the transactions broadcast
+        with it cost one write and one drain instead of one each.
+        """
+        while True:
+            frames = [await outbox.get()]
+            while len(frames) < OUTBOX_BATCH_SIZE and not outbox.empty():
+                frames.append(outbox.get_nowait())
+            if not await self._send_async(peer, frames):
+                return
+    
+    async def _send_async(self, peer: PeerAddress, frames: List[bytes]) -> bool:
+        """Write framed messages to one peer, dropping it if unreachable"""
+        for attempt in range(2):
             try:
-                host, port = peer.split(':')
-                port = int(port)
-                
-                client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                client_socket.connect((host, port))
-                client_socket.send(message_str.encode('utf-8'))
-                client_socket.close()
+                reader, writer = await self._get_connection(peer)
+                if reader.at_eof() or writer.is_closing():
+                    raise ConnectionResetError("Connection closed by peer")
+                # writelines hands all frames to the transport at once
+                writer.writelines(frames)
+                await writer.drain()
+                return True
+            except Exception as e:
+                self._drop_connection(peer)
+                # A pooled connection may have gone stale; reconnect once
+                # before giving up on the peer
+                if attempt == 1:
+                    print(f"Failed to send message to {peer[0]}:{peer[1]}: {e}")
+                    self._discard_peer(peer)
+        return False
+    
+    def _get_connection(self, peer: PeerAddress) -> asyncio.Future:
+        """
+        Return the pooled connection to a peer, opening it on first use.
+        
+        Concurrent callers share the same pending connect instead of
+        opening one connection each.
+        """
+        connection = self._connections.get(peer)
+        if connection is None:
+            connection = asyncio.ensure_future(open_stream(*peer))
+            self._connections[peer] = connection
+        return connection
+    
+    def _forget_peer(self, peer: PeerAddress):
+        """Discard a removed peer's outbox, writer task and connection (runs on the event loop)"""
+        self._outboxes.pop(peer, None)
+        task = self._writer_tasks.pop(peer, None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        self._drop_connection(peer)
+    
+    def _drop_connection(self, peer: PeerAddress):
+        """Forget the pooled connection to a peer and close it (runs on the event loop)"""
+        connection = self._connections.pop(peer, None)
+        if connection is None:
+            return
+        if connection.done() and not connection.exception():
+            connection.result()[1].close()
+        else:
+            connection.cancel()
+    
+    def send_to_peers(self, frame: bytes, peers: Tuple[PeerAddress, ...]):
+        """Send a framed message to each peer, dropping unreachable ones"""
+        for host, port in peers:
+            try:
+                send_frame(host, port, frame)
             except Exception as e:
-                print(f"Failed to send message to {peer}: {e}")
-                self.remove_peer(peer)
+                print(f"Failed to send message to {host}:{port}: {e}")
+                self._discard_peer((host, port))
     
     def handle_new_transaction(self, transaction_data: Dict):
         """Handle a new transaction from a peer"""
+        # Drop transactions whose ID was already seen, in the mempool or in
+        # the chain, before doing any other work (O(1) set lookup)
+        if transaction_data['transaction_id'] in self.blockchain.transaction_ids:
+            return
+        
         # Create transaction object
-        transaction = Transaction(
-            sender=transaction_data['sender'],
-            recipient=transaction_data['recipient'],
-            amount=transaction_data['amount'],
-            transaction_id=transaction_data['transaction_id'],
-            timestamp=transaction_data['timestamp'],
-            signature=transaction_data['signature']
-        )
+        transaction = Transaction.from_dict(transaction_data)
+        
+        # Add to pending transactions only if the sender's balance and the
+        # double-spend check pass. Wallet keys stay on the node that created
+        # them, so the signature is checked only when the signer is known here
+        if not self.blockchain.add_transactions_batch([transaction], allow_unknown_signers=True):
+            return
+        print(f"Received new transaction from peer: {transaction.sender} -> {transaction.recipient}")
         
-        # Add to pending transactions if not already present
-        if not any(tx.transaction_id == transaction.transaction_id 
-                  for tx in self.blockchain.pending_transactions):
-            self.blockchain.pending_transactions.append(transaction)
-            print(f"Received new transaction from peer: {transaction.sender} -> {transaction.recipient}")
+        # Relay only validated transactions; nodes that already have it drop
+        # it on the ID check above
+        self.broadcast_transaction(transaction)
     
     def handle_new_block(self, block_data: Dict):
         """Handle a new block from a peer"""
-        # Create block object
-        transactions = []
-        for tx_data in block_data['transactions']:
-            tx = Transaction(
-                sender=tx_data['sender'],
-                recipient=tx_data['recipient'],
-                amount=tx_data['amount'],
-                transaction_id=tx_data['transaction_id'],
-                timestamp=tx_data['timestamp'],
-                signature=tx_data.get('signature')
-            )
-            transactions.append(tx)
+        # Gossip delivers most blocks more than once; a block that does not
+        # extend our chain is dropped before any of it is decoded or hashed
+        if block_data['previous_hash'] != self.blockchain.get_latest_block().hash:
+            return
         
-        block = Block(
-            index=block_data['index'],
-            timestamp=block_data['timestamp'],
-            transactions=transactions,
-            previous_hash=block_data['previous_hash'],
-            nonce=block_data['nonce'],
-            difficulty=block_data['difficulty'],
-            merkle_root=block_data['merkle_root']
-        )
-        block.hash = block_data['hash']
+        # Create block object
+        block = Block.from_dict(block_data)
         
-        # Add block if it's valid and extends our chain
-        if (self.blockchain.is_block_valid(block) and 
-            block.previous_hash == self.blockchain.get_latest_block().hash):
+        # Add block if it's valid (is_block_valid re-checks that it extends our chain)
+        if self.blockchain.is_block_valid(block):
             self.blockchain.add_block(block)
             print(f"Received new block from peer: Block #{block.index}")
             
             # Remove transactions that are now in the block
             block_tx_ids = {tx.transaction_id for tx in block.transactions}
-            self.blockchain.pending_transactions = [
-                tx for tx in self.blockchain.pending_transactions
-                if tx.transaction_id not in block_tx_ids
-            ]
+            self.blockchain.remove_pending_transactions(block_tx_ids)
+            
+            # Relay it; nodes that already have it no longer see it extend their chain
+            self.broadcast_block(block)
     
-    def request_chain(self, peer_address: str):
+    def request_chain(self, peer: PeerAddress):
         """Request the blockchain from a specific peer"""
+        request = self._request_chain(peer)
+        if self.loop is None:
+            asyncio.run(request)  # Node was never started; fetch on this thread
+        else:
+            future = asyncio.run_coroutine_threadsafe(request, self.loop)
+            self._requests.add(future)
+            future.add_done_callback(self._requests.discard)
+    
+    async def _request_chain(self, peer: PeerAddress):
+        """
+        Ask a peer for its chain and read the blocks it streams back.
+        
+        The peer answers on the same connection with a 4-byte block count
+        followed by one length-prefixed JSON frame per block.
+        """
         try:
-            host, port = peer_address.split(':')
-            port = int(port)
-            
-            message = {'type': 'chain_request'}
-            message_str = json.dumps(message)
+            reader, writer = await open_stream(*peer)
+            try:
+                writer.write(encode_message({'type': 'chain_request'}))
+                await writer.drain()
+                
+                count = int.from_bytes(await reader.readexactly(FRAME_HEADER_SIZE), 'big')
+                # Longest chain rule: don't download a chain we would not adopt
+                if count <= len(self.blockchain.chain):
+                    return
+                # The count comes from the peer; bound it, and the bytes read,
+                # before buffering any blocks
+                if count > len(self.blockchain.chain) + MAX_CHAIN_LEAD:
+                    raise ValueError(f"peer announced {count} blocks, more than {MAX_CHAIN_LEAD} ahead of ours")
+                
+                chain_data = []
+                received = 0
+                for _ in range(count):
+                    frame = await read_sized(reader)
+                    received += len(frame)
+                    if received > MAX_CHAIN_DOWNLOAD:
+                        raise ValueError(f"chain exceeds the {MAX_CHAIN_DOWNLOAD} byte download limit")
+                    chain_data.append(orjson.loads(frame))
+            finally:
+                writer.close()
             
-            client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            client_socket.connect((host, port))
-            client_socket.send(message_str.encode('utf-8'))
-            client_socket.close()
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._worker, self.handle_chain_response, chain_data)
         except Exception as e:
-            print(f"Failed to request chain from {peer_address}: {e}")
+            print(f"Failed to request chain from {peer[0]}:{peer[1]}: {e}")
     
-    def send_chain(self, address):
-        """Send the blockchain to a requesting peer"""
+    async def send_chain(self, writer: asyncio.StreamWriter):
+        """
+        Stream the blockchain to a requesting peer, one framed block at a time.
+        
+        drain() waits whenever the peer falls behind, so a slow peer never
+        makes the node buffer more than the socket's share of the chain.
+        """
+        chain = list(self.blockchain.chain)  # Blocks mined meanwhile go in the next sync
+        frames = self._encoded_chain_frames(chain)
         try:
-            host, port = address
-            peer_address = f"{host}:{port}"
-            
-            # Convert blockchain to serializable format
-            chain_data = []
-            for block in self.blockchain.chain:
-                block_dict = block.to_dict()
-                block_dict['hash'] = block.hash
-                chain_data.append(block_dict)
-            
-            message = {
-                'type': 'chain_response',
-                'chain': chain_data
-            }
-            message_str = json.dumps(message)
+            writer.write(len(chain).to_bytes(FRAME_HEADER_SIZE, 'big'))
+            for i in range(len(chain)):
+                writer.write(frames[i])
+                await writer.drain()
+        except ConnectionError:
+            pass  # Requester hung up after the count: its chain is at least as long
+    
+    def _encoded_chain_frames(self, chain: List[Block]) -> List[bytes]:
+        """
+        Return the length-prefixed JSON frame of every block in chain.
+        
+        Frames from earlier requests are reused and only blocks added since
+        are encoded. If the chain was replaced by a peer's, the cache is
+        rebuilt from the first block.
+        
+        Args:
+            chain (List[Block]): Snapshot of the chain being sent
             
-            client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            client_socket.connect((host, port))
-            client_socket.send(message_str.encode('utf-8'))
-            client_socket.close()
-        except Exception as e:
-            print(f"Failed to send chain to {address}: {e}")
+        Returns:
+            List[bytes]: At least len(chain) frames, in block order
+        """
+        frames = self._chain_frames
+        # Block hashes chain together, so a matching hash at the last cached
+        # height means the whole cached prefix is still ours
+        if frames and (len(frames) > len(chain)
+                       or chain[len(frames) - 1].hash != self._chain_frames_tip):
+            frames = self._chain_frames = []  # In-flight sends keep the old list
+        
+        for block in chain[len(frames):]:
+            block_dict = block.to_dict()
+            block_dict['hash'] = block.hash
+            payload = orjson.dumps(block_dict)
+            frames.append(len(payload).to_bytes(FRAME_HEADER_SIZE, 'big') + payload)
+        if chain:
+            self._chain_frames_tip = chain[-1].hash
+        return frames
     
     def handle_chain_response(self, chain_data: List[Dict]):
         """Handle blockchain response from a peer"""
         # Implement longest chain rule
-        if len(chain_data) > len(self.blockchain.chain):
-            # Validate the received chain
-            if self.validate_received_chain(chain_data):
-                self.blockchain.chain = []
-                for block_data in chain_data:
-                    transactions = []
-                    for tx_data in block_data['transactions']:
-                        tx = Transaction(
-                            sender=tx_data['sender'],
-                            recipient=tx_data['recipient'],
-                            amount=tx_data['amount'],
-                            transaction_id=tx_data['transaction_id'],
-                            timestamp=tx_data['timestamp'],
-                            signature=tx_data.get('signature')
-                        )
-                        transactions.append(tx)
-                    
-                    block = Block(
-                        index=block_data['index'],
-                        timestamp=block_data['timestamp'],
-                        transactions=transactions,
-                        previous_hash=block_data['previous_hash'],
-                        nonce=block_data['nonce'],
-                        difficulty=block_data['difficulty'],
-                        merkle_root=block_data['merkle_root']
-                    )
-                    block.hash = block_data['hash']
-                    self.blockchain.chain.append(block)
-                
-                self.blockchain.update_utxo_set()
-                print(f"Updated blockchain from peer: {len(chain_data)} blocks")
-    
-    def validate_received_chain(self, chain_data: List[Dict]) -> bool:
-        """Validate a received blockchain"""
-        if not chain_data:
-            return False
+        if len(chain_data) <= len(self.blockchain.chain):
+            return
         
-        # Check genesis block
-        if chain_data[0]['index'] != 0 or chain_data[0]['previous_hash'] != "0":
-            return False
-        
-        # Check chain integrity
-        for i in range(1, len(chain_data)):
-            current_block = chain_data[i]
-            previous_block = chain_data[i - 1]
-            
-            if current_block['previous_hash'] != previous_block['hash']:
-                return False
+        # Validate and build each block in a single pass. The new chain is
+        # assembled separately and only swapped in once every block checks
+        # out, so a bad block leaves our chain untouched.
+        new_chain = []
+        previous_hash = "0"  # The genesis block has no predecessor
+        for index, block_data in enumerate(chain_data):
+            if block_data['index'] != index or block_data['previous_hash'] != previous_hash:
+                return
             
-            if current_block['index'] != previous_block['index'] + 1:
-                return False
+            block = Block.from_dict(block_data)
+            previous_hash = block.hash
+            new_chain.append(block)
         
-        return True
+        self.blockchain.chain = new_chain
+        self.blockchain.rebuild_transaction_index()
+        self.blockchain.update_utxo_set()
+        print(f"Updated blockchain from peer: {len(chain_data)} blocks")
     
     def handle_peer_discovery(self, peers: List[str]):
         """Handle peer discovery message"""
         for peer in peers:
-            if peer != f"{self.host}:{self.port}":
-                self.add_peer(peer)
+            self.add_peer(peer)  # Skips our own address
     
     def discover_peers(self):
         """Discover peers by broadcasting our address"""
@@ -329,18 +611,19 @@ class P2PNode:
             'type': 'peer_discovery',
             'peers': [f"{self.host}:{self.port}"]
         }
-        self.broadcast_message(message)
+        # Discovery messages are not relayed, so announce to every peer
+        self.broadcast_message(message, fanout=len(self.peer_snapshot))
     
     def sync_with_network(self):
         """Sync blockchain with the network"""
-        for peer in list(self.peers):
+        for peer in self.peer_snapshot:
             self.request_chain(peer)
     
     def get_network_info(self) -> Dict:
         """Get information about the P2P network"""
         return {
             'node_address': f"{self.host}:{self.port}",
-            'peers': list(self.peers),
+            'peers': [f"{host}:{port}" for host, port in self.peer_snapshot],
             'blockchain_length': len(self.blockchain.chain),
             'pending_transactions': len(self.blockchain.pending_transactions)
         }